@@ -9,8 +9,12 @@ from __future__ import annotations
 
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+# Raw frames are batched into writes of about this size on FFmpeg's stdin.
+_STDIN_CHUNK = 4 * 1024 * 1024
 
 
 class VideoComposer:
@@ -115,6 +119,85 @@ class VideoComposer:
 
         return output_path
 
+    def merge_segment_stream(
+        self,
+        frames: Iterable[bytes],
+        audio_path: str | Path,
+        output_path: str | Path,
+        size: str = "1920x1080",
+        fps: int = 30,
+        pix_fmt: str = "yuv420p",
+    ) -> Path:
+        """
+        Encode raw frames piped on stdin together with an audio track.
+
+        Skips writing and re-reading an intermediate .mp4: `frames` yields raw
+        `pix_fmt` frames of `size`, which a writer thread feeds to FFmpeg's
+        stdin in ~4 MB chunks while FFmpeg encodes. On any failure the
+        partial output file is removed.
+
+        Not yet called from the render path — it is the entry point for a
+        renderer that emits raw frames instead of an .mp4.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            self.ffmpeg_path,
+            "-y",
+            "-f", "rawvideo", "-pix_fmt", pix_fmt, "-s", size, "-r", str(fps),
+            "-i", "pipe:0",
+            "-i", str(audio_path),
+            "-c:v", "libx264", "-preset", "ultrafast", "-crf", "23",
+            "-threads", "4",
+            "-c:a", "aac", "-ar", "44100", "-b:a", "128k",
+            "-map", "0:v:0", "-map", "1:a:0",
+            "-shortest",
+            str(output_path),
+        ]
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        feed_errors: list[BaseException] = []
+
+        def _feed() -> None:
+            buf = bytearray()
+            try:
+                for frame in frames:
+                    buf += frame
+                    if len(buf) >= _STDIN_CHUNK:
+                        proc.stdin.write(buf)
+                        buf.clear()
+                if buf:
+                    proc.stdin.write(buf)
+            except BrokenPipeError:
+                pass  # FFmpeg exited early — its stderr says why
+            except Exception as exc:  # noqa: BLE001 — re-raised below
+                feed_errors.append(exc)
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        writer = threading.Thread(target=_feed, name="ffmpeg-stdin", daemon=True)
+        writer.start()
+        stderr = proc.stderr.read()   # drain while writing, or a full pipe deadlocks
+        writer.join()
+        returncode = proc.wait()
+
+        if feed_errors or returncode != 0:
+            # A truncated file would otherwise look like a finished segment.
+            output_path.unlink(missing_ok=True)
+        if feed_errors:
+            raise RuntimeError(f"Frame source failed: {feed_errors[0]}") from feed_errors[0]
+        if returncode != 0:
+            raise RuntimeError(
+                f"FFmpeg stream merge failed: {stderr.decode('utf-8', errors='replace')}"
+            )
+
+        return output_path
+
     def concatenate(
         self,
         segment_paths: list[str | Path],
@@ -143,6 +226,68 @@ class VideoComposer:
         else:
             return self._concat_xfade(segment_paths, output_path, crossfade)
 
+    def render_full(
+        self,
+        segments: list[tuple[str | Path, str | Path | None]],
+        output_path: str | Path,
+    ) -> Path:
+        """
+        Merge every (video, audio) pair and concatenate them in one FFmpeg run.
+
+        Equivalent to merge_segment() per pair followed by concatenate(), but
+        with a single process and no intermediate merged .mp4 files.  Each
+        segment lasts as long as its audio (video padded with its last frame
+        or trimmed); a segment without audio keeps its video length over
+        silence.  The concat filter works on decoded frames, so the video is
+        re-encoded once here instead of stream-copied.
+        """
+        if not segments:
+            raise ValueError("No segments to concatenate")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = [self.ffmpeg_path, "-y"]
+        chains: list[str] = []
+        labels: list[str] = []
+        for i, (video_path, audio_path) in enumerate(segments):
+            video_dur = self._get_duration(video_path)
+            cmd += ["-i", str(video_path)]
+            if audio_path is None:
+                seg_dur = video_dur
+                cmd += ["-f", "lavfi", "-t", f"{seg_dur:.2f}", "-i", "anullsrc=r=44100:cl=stereo"]
+            else:
+                seg_dur = self._get_duration(audio_path)
+                cmd += ["-i", str(audio_path)]
+
+            pad = max(0.0, seg_dur - video_dur) + 0.1
+            v, a = 2 * i, 2 * i + 1
+            chains.append(
+                f"[{v}:v]tpad=stop_mode=clone:stop_duration={pad:.2f},"
+                f"trim=duration={seg_dur:.2f},setpts=PTS-STARTPTS[v{i}]"
+            )
+            chains.append(
+                f"[{a}:a]aformat=sample_rates=44100:channel_layouts=stereo,apad,"
+                f"atrim=duration={seg_dur:.2f},asetpts=PTS-STARTPTS[a{i}]"
+            )
+            labels.append(f"[v{i}][a{i}]")
+        chains.append(f"{''.join(labels)}concat=n={len(segments)}:v=1:a=1[v][a]")
+
+        cmd += [
+            "-filter_complex", ";".join(chains),
+            "-map", "[v]", "-map", "[a]",
+            "-c:v", "libx264", "-preset", "ultrafast", "-crf", "23",
+            "-threads", "4",
+            "-c:a", "aac", "-ar", "44100", "-b:a", "128k",
+            str(output_path),
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace")
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg render_full failed: {result.stderr}")
+
+        return output_path
+
     def _concat_demuxer(
         self,
         segment_paths: list[str | Path],
@@ -43,6 +43,15 @@ class Settings(BaseSettings):
         default="bulbul:v3",
         description="Sarvam AI TTS model",
     )
+    tts_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max in-flight Sarvam TTS requests per process, shared across jobs "
+                    "(unset = min(available CPUs, 4))",
+    )
+    tts_trim_min_duration: float = Field(
+        default=1.5,
+        description="Clips at or below this many seconds skip silence trimming",
+    )
 
     # ── Defaults ───────────────────────────────────────────────────
     default_voice: str = Field(default="shubh", description="Default TTS voice ID")
@@ -58,6 +67,10 @@ class Settings(BaseSettings):
     render_resolution: str = Field(default="1920x1080", description="Video resolution")
     render_fps: int = Field(default=30, description="Video frame rate")
     crossfade_duration: float = Field(default=0.5, description="Crossfade between segments (seconds)")
+    single_pass_compose: bool = Field(
+        default=False,
+        description="Merge audio and concatenate all beats in one FFmpeg run (re-encodes video once)",
+    )
 
     # ── Manim ──────────────────────────────────────────────────────
     manim_quality: str = Field(
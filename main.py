@@ -22,6 +22,7 @@ import asyncio
 import logging
 import time
 import uuid
+from operator import itemgetter
 from pathlib import Path
 
 # ── Windows UTF-8 fix ────────────────────────────────────────────────────────
@@ -54,6 +55,8 @@ logging.basicConfig(
 )
 log = logging.getLogger("mathviz.api")
 
+_beat_id = itemgetter("beat_id")   # beat dict → beat_id, applied via C-level map()
+
 # ── App ──────────────────────────────────────────────────────────────────────
 app = FastAPI(
     title="MathViz Engine",
@@ -79,6 +82,17 @@ async def _update_job(job_id: str, updates: dict) -> None:
         _jobs[job_id].update(updates)
 
 
+# One AudioCache per process: jobs share its manifest and in-memory LRU.
+_audio_cache: AudioCache | None = None
+
+
+def _get_audio_cache() -> AudioCache:
+    global _audio_cache
+    if _audio_cache is None:
+        _audio_cache = AudioCache(settings.audio_cache_dir)
+    return _audio_cache
+
+
 # ── Request / Response models ─────────────────────────────────────────────────
 
 class GenerateRequest(BaseModel):
@@ -232,7 +246,7 @@ async def _run_pipeline(job_id: str, request: GenerateRequest) -> None:
             raise ValueError("SARVAM_API_KEY not set — cannot generate audio.")
 
         tts   = SarvamTTS(api_key=settings.sarvam_api_key, voice=request.voice, model=settings.sarvam_model)
-        cache = AudioCache(settings.audio_cache_dir)
+        cache = _get_audio_cache()
         audio_dir = settings.audio_dir / job_id
 
         audio_clips = await generate_all_audio(
@@ -247,12 +261,13 @@ async def _run_pipeline(job_id: str, request: GenerateRequest) -> None:
         # Duration map: TTS duration → Manim scene length
         durations:   dict[str, float] = {}
         audio_paths: dict[str, Path]  = {}
+        min_dur = settings.min_beat_duration   # read once, not per beat
         for beat in beats:
             bid  = beat["beat_id"]
             clip = audio_clips.get(bid)
             tts_dur = clip.duration if (clip and clip.duration > 0) else 8.0
             # Enforce minimum so viewers have time to absorb each visual
-            durations[bid] = max(tts_dur, settings.min_beat_duration)
+            durations[bid] = tts_dur if tts_dur > min_dur else min_dur
             wav = audio_dir / f"{bid}.wav"
             if wav.exists():
                 audio_paths[bid] = wav
@@ -287,64 +302,68 @@ async def _run_pipeline(job_id: str, request: GenerateRequest) -> None:
             (bid, file_path, class_name, media_dir / bid)
             for bid, file_path, class_name in scene_entries
         ]
+        final_path   = settings.final_dir / f"{job_id}.mp4"
 
-        rendered_map, render_errors = await render_engine.render_all_parallel(
-            tasks       = render_tasks,
-            quality     = request.quality,
-            max_workers = settings.max_render_workers,
-        )
-
-        render_failures = len(beats) - len(rendered_map)
-        if render_failures:
-            log.warning("[%s] %d/%d beats failed to render", job_id, render_failures, len(beats))
-            for beat_id, err in render_errors.items():
-                log.error("[%s] Render error [%s]: %s", job_id, beat_id, err[:300])
-        if not rendered_map:
-            raise RuntimeError(
-                f"All {len(beats)} beats failed to render. "
-                f"First error: {next(iter(render_errors.values()), 'unknown')[:300]}"
+        if settings.single_pass_compose:
+            rendered_map, render_errors = await render_engine.render_all_parallel(
+                tasks       = render_tasks,
+                quality     = request.quality,
+                max_workers = settings.max_render_workers,
             )
 
-        await _update_job(job_id, {"render_errors": render_errors})
-
-        log.info("[%s] Rendered %d/%d beats", job_id, len(rendered_map), len(beats))
-
-        # ── Step 6: Merge audio + video per beat ──────────────────────────
-        await _update_job(job_id, {"status": "composing"})
-
-        merged_dir = settings.raw_dir / "merged" / job_id
-        merged_dir.mkdir(parents=True, exist_ok=True)
-
-        beat_order   = [b["beat_id"] for b in beats]
-        merge_tasks  = []
+            render_failures = len(beats) - len(rendered_map)
+            if render_failures:
+                log.warning("[%s] %d/%d beats failed to render", job_id, render_failures, len(beats))
+                for beat_id, err in render_errors.items():
+                    log.error("[%s] Render error [%s]: %s", job_id, beat_id, err[:300])
+            if not rendered_map:
+                raise RuntimeError(
+                    f"All {len(beats)} beats failed to render. "
+                    f"First error: {next(iter(render_errors.values()), 'unknown')[:300]}"
+                )
 
-        for bid in beat_order:
-            video_path = rendered_map.get(bid)
-            if video_path is None:
-                log.warning("[%s] Skipping missing beat: %s", job_id, bid)
-                continue
-            out = merged_dir / f"{bid}_merged.mp4"
-            merge_tasks.append(
-                composer.merge_segment(video_path, audio_paths.get(bid), out)
+            await _update_job(job_id, {"render_errors": render_errors})
+
+            log.info("[%s] Rendered %d/%d beats", job_id, len(rendered_map), len(beats))
+
+            # ── Steps 6+7 in one FFmpeg run, no intermediate merged files ──
+            await _update_job(job_id, {"status": "composing"})
+
+            segments: list[tuple[Path, Path | None]] = []
+            for bid in map(_beat_id, beats):
+                video_path = rendered_map.get(bid)
+                if video_path is None:
+                    log.warning("[%s] Skipping missing beat: %s", job_id, bid)
+                    continue
+                segments.append((video_path, audio_paths.get(bid)))
+
+            log.info("[%s] Step 6-7: Composing %d beats in one pass", job_id, len(segments))
+            await composer.render_full(segments, final_path)
+            final_segments: list[Path] = [video for video, _ in segments]
+            merge_failures: list[str] = []
+        else:
+            # ── Steps 5-7 overlapped: each beat is merged as soon as it renders ──
+            async def _on_composing(render_errors: dict[str, str]) -> None:
+                if render_errors:
+                    log.warning("[%s] %d/%d beats failed to render", job_id, len(render_errors), len(beats))
+                    for beat_id, err in render_errors.items():
+                        log.error("[%s] Render error [%s]: %s", job_id, beat_id, err[:300])
+                await _update_job(job_id, {"render_errors": render_errors})
+                await _update_job(job_id, {"status": "composing"})
+
+            merged_map, _, merge_errors = await composer.pipeline(
+                tasks        = render_tasks,
+                audio_paths  = audio_paths,
+                merged_dir   = settings.raw_dir / "merged" / job_id,
+                output_path  = final_path,
+                quality      = request.quality,
+                max_workers  = settings.max_render_workers,
+                on_composing = _on_composing,
             )
 
-        merged_results = await asyncio.gather(*merge_tasks, return_exceptions=True)
-
-        final_segments: list[Path] = [
-            r for r in merged_results if not isinstance(r, Exception)
-        ]
-        merge_failures = [str(r) for r in merged_results if isinstance(r, Exception)]
-        for f in merge_failures:
-            log.error("[%s] Merge failed: %s", job_id, f)
-
-        if not final_segments:
-            raise RuntimeError("No beats merged successfully.")
-
-        # ── Step 7: Concatenate into final video ──────────────────────────
-        log.info("[%s] Step 7: Concatenating %d beats", job_id, len(final_segments))
-
-        final_path = settings.final_dir / f"{job_id}.mp4"
-        await composer.concat_segments(final_segments, final_path)
+            log.info("[%s] Composed %d/%d beats", job_id, len(merged_map), len(beats))
+            final_segments = list(merged_map.values())
+            merge_failures = list(merge_errors.values())
 
         render_time = round(time.monotonic() - t_start, 1)
         log.info("[%s] Done in %.1fs → %s", job_id, render_time, final_path)
@@ -6,8 +6,11 @@ Avoids redundant API calls when narration text hasn't changed.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import threading
+from collections import OrderedDict
 from dataclasses import asdict
 from pathlib import Path
 from typing import Optional
@@ -21,13 +24,46 @@ class AudioCache:
 
     Cache key: sha256(narration_text + voice + language)
     Stores .wav files and a manifest.json mapping hashes to metadata.
+
+    The most recently used clips are also kept in memory (up to
+    memory_entries clips and memory_bytes of audio) so repeat hits skip
+    the disk read. All access is guarded by a lock, so one instance can
+    be shared across jobs.
     """
 
-    def __init__(self, cache_dir: str | Path):
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        memory_entries: int = 64,
+        memory_bytes: int = 32 * 1024 * 1024,
+    ):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_path = self.cache_dir / "manifest.json"
         self.manifest = self._load_manifest()
+        self.memory_entries = memory_entries
+        self.memory_bytes = memory_bytes
+        self._memory: OrderedDict[str, AudioClip] = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.RLock()
+
+    def _remember(self, key: str, clip: AudioClip) -> None:
+        """Insert/promote key in the in-memory LRU, evicting oldest entries past either cap."""
+        size = len(clip.audio_bytes)
+        if size > self.memory_bytes:
+            self._forget(key)  # never let one huge clip flush the whole LRU
+            return
+        self._forget(key)
+        self._memory[key] = clip
+        self._memory_used += size
+        while len(self._memory) > self.memory_entries or self._memory_used > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_used -= len(evicted.audio_bytes)
+
+    def _forget(self, key: str) -> None:
+        clip = self._memory.pop(key, None)
+        if clip is not None:
+            self._memory_used -= len(clip.audio_bytes)
 
     def _load_manifest(self) -> dict:
         """Load the cache manifest from disk."""
@@ -42,8 +78,9 @@ class AudioCache:
             json.dump(self.manifest, f, indent=2)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _compute_key(text: str, voice: str, language: str) -> str:
-        """Compute cache key from text + voice + language."""
+        """Compute cache key from text + voice + language (memoised: a miss hashes on get and put)."""
         content = f"{text}|{voice}|{language}"
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
@@ -60,6 +97,15 @@ class AudioCache:
         """
         key = self._compute_key(text, voice, language)
 
+        with self._lock:
+            clip = self._memory.get(key)
+            if clip is not None:
+                self._memory.move_to_end(key)
+                return clip
+            return self._get_from_disk(key, text)
+
+    def _get_from_disk(self, key: str, text: str) -> AudioClip | None:
+        """Load a clip from disk, dropping stale manifest entries. Caller holds the lock."""
         if key not in self.manifest:
             return None
 
@@ -75,12 +121,14 @@ class AudioCache:
         with open(audio_path, "rb") as f:
             audio_bytes = f.read()
 
-        return AudioClip(
+        clip = AudioClip(
             audio_bytes=audio_bytes,
             duration=entry.get("duration", 0.0),
             sample_rate=entry.get("sample_rate", 22050),
             text=text,
         )
+        self._remember(key, clip)
+        return clip
 
     def put(
         self,
@@ -98,20 +146,22 @@ class AudioCache:
         filename = f"{key}.wav"
         audio_path = self.cache_dir / filename
 
-        # Write audio bytes
-        with open(audio_path, "wb") as f:
-            f.write(clip.audio_bytes)
-
-        # Update manifest
-        self.manifest[key] = {
-            "filename": filename,
-            "duration": clip.duration,
-            "sample_rate": clip.sample_rate,
-            "text_preview": text[:100],
-            "voice": voice,
-            "language": language,
-        }
-        self._save_manifest()
+        with self._lock:
+            # Write audio bytes
+            with open(audio_path, "wb") as f:
+                f.write(clip.audio_bytes)
+
+            # Update manifest
+            self.manifest[key] = {
+                "filename": filename,
+                "duration": clip.duration,
+                "sample_rate": clip.sample_rate,
+                "text_preview": text[:100],
+                "voice": voice,
+                "language": language,
+            }
+            self._save_manifest()
+            self._remember(key, clip)
 
         return audio_path
 
@@ -126,21 +176,26 @@ class AudioCache:
     def invalidate(self, text: str, voice: str = "meera", language: str = "en") -> None:
         """Remove a specific entry from the cache."""
         key = self._compute_key(text, voice, language)
-        if key in self.manifest:
-            audio_path = self.cache_dir / self.manifest[key]["filename"]
-            if audio_path.exists():
-                audio_path.unlink()
-            del self.manifest[key]
-            self._save_manifest()
+        with self._lock:
+            self._forget(key)
+            if key in self.manifest:
+                audio_path = self.cache_dir / self.manifest[key]["filename"]
+                if audio_path.exists():
+                    audio_path.unlink()
+                del self.manifest[key]
+                self._save_manifest()
 
     def clear(self) -> None:
         """Clear the entire cache."""
-        for key, entry in self.manifest.items():
-            audio_path = self.cache_dir / entry["filename"]
-            if audio_path.exists():
-                audio_path.unlink()
-        self.manifest.clear()
-        self._save_manifest()
+        with self._lock:
+            for key, entry in self.manifest.items():
+                audio_path = self.cache_dir / entry["filename"]
+                if audio_path.exists():
+                    audio_path.unlink()
+            self.manifest.clear()
+            self._memory.clear()
+            self._memory_used = 0
+            self._save_manifest()
 
     @property
     def size(self) -> int:
@@ -10,8 +10,10 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
+from typing import Awaitable, Callable
 
 from composer.ffmpeg_merge import VideoComposer
+from renderer.render_engine import render_segment_subprocess
 
 log = logging.getLogger(__name__)
 
@@ -70,3 +72,149 @@ async def concat_segments(
         str(output_path),
         0,   # crossfade=0 → concat demuxer, no re-encode
     )
+
+
+async def render_full(
+    segments: list[tuple[Path, Path | None]],
+    output_path: Path,
+) -> Path:
+    """
+    Merge and concatenate (video, audio) pairs into one .mp4 in a single
+    FFmpeg run — replaces merge_segment() per beat + concat_segments().
+
+    A pair whose audio is None or missing on disk is rendered over silence.
+    """
+    if not segments:
+        raise ValueError("No segments to concatenate")
+
+    pairs = [
+        (video, audio if audio is not None and audio.exists() else None)
+        for video, audio in segments
+    ]
+    log.info("Composing %d segments in one pass → %s", len(pairs), output_path)
+    return await asyncio.to_thread(_get_vc().render_full, pairs, output_path)
+
+
+async def pipeline(
+    tasks: list[tuple[str, Path, str, Path]],
+    audio_paths: dict[str, Path],
+    merged_dir: Path,
+    output_path: Path,
+    quality: str = "medium",
+    max_workers: int = 4,
+    queue_size: int = 2,
+    on_composing: Callable[[dict[str, str]], Awaitable[None]] | None = None,
+) -> tuple[dict[str, Path], dict[str, str], dict[str, str]]:
+    """
+    Render → merge → concat as three stages joined by bounded queues.
+
+    Each beat is merged with its audio as soon as its own render finishes
+    instead of after the slowest render; the final concat runs once every
+    merge is in, in `tasks` order.
+
+    Args:
+        tasks:       List of (segment_id, scene_file, class_name, media_dir).
+        audio_paths: segment_id → narration .wav (missing → silent copy).
+        merged_dir:  Where the per-beat merged .mp4 files are written.
+        output_path: Final concatenated .mp4.
+        quality:     "low" | "medium" | "high".
+        max_workers:  Max concurrent Manim subprocesses, and separately max
+                      concurrent FFmpeg merges.
+        queue_size:   Max finished items waiting between two stages.
+        on_composing: Awaited with the render errors once every render has
+                      finished (merges may already be running) — lets the
+                      caller publish them and report "composing".
+
+    Returns:
+        (merged_map, render_errors, merge_errors) — segment_id → merged .mp4,
+        and segment_id → error message for each beat dropped at that stage.
+
+    Raises:
+        RuntimeError: if no beat survives both render and merge.
+    """
+    rendered_q: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    merged_q:   asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    semaphore = asyncio.Semaphore(max_workers)
+    merge_sem = asyncio.Semaphore(max_workers)
+    render_errors: dict[str, str] = {}
+    merge_errors:  dict[str, str] = {}
+    merged_map: dict[str, Path] = {}
+    merged_dir.mkdir(parents=True, exist_ok=True)
+
+    async def _render_one(seg_id: str, scene_file: Path, class_name: str, media_dir: Path):
+        async with semaphore:
+            try:
+                mp4 = await asyncio.to_thread(
+                    render_segment_subprocess, scene_file, class_name, media_dir, quality,
+                )
+            except Exception as exc:  # noqa: BLE001 — one bad beat must not stop the rest
+                log.error("Render failed [%s]: %s", seg_id, exc)
+                render_errors[seg_id] = str(exc)[:500]
+                return
+        await rendered_q.put((seg_id, mp4))
+
+    async def _render_stage():
+        await asyncio.gather(*(_render_one(*t) for t in tasks))
+        await rendered_q.put(None)
+        if on_composing is not None:
+            try:
+                await on_composing(render_errors)
+            except Exception as exc:  # noqa: BLE001 — a status update must not abort the job
+                log.warning("on_composing callback failed: %s", exc)
+
+    async def _merge_one(seg_id: str, mp4: Path):
+        try:
+            merged = await merge_segment(
+                mp4, audio_paths.get(seg_id), merged_dir / f"{seg_id}_merged.mp4",
+            )
+        except Exception as exc:  # noqa: BLE001
+            log.error("Merge failed [%s]: %s", seg_id, exc)
+            merge_errors[seg_id] = str(exc)[:500]
+        else:
+            await merged_q.put((seg_id, merged))
+        finally:
+            merge_sem.release()
+
+    async def _merge_stage():
+        # Up to max_workers merges in flight; a slot is taken before the next
+        # rendered clip is dequeued, so the rendered queue still backs up.
+        merges: list[asyncio.Task] = []
+        try:
+            while True:
+                await merge_sem.acquire()
+                item = await rendered_q.get()
+                if item is None:
+                    merge_sem.release()
+                    break
+                merges.append(asyncio.create_task(_merge_one(*item)))
+            await asyncio.gather(*merges)
+        except asyncio.CancelledError:
+            for m in merges:
+                m.cancel()
+            raise
+        await merged_q.put(None)
+
+    async def _concat_stage():
+        while (item := await merged_q.get()) is not None:
+            seg_id, merged = item
+            merged_map[seg_id] = merged
+        ordered = [merged_map[t[0]] for t in tasks if t[0] in merged_map]
+        if not ordered:
+            first = next(iter((*render_errors.values(), *merge_errors.values())), "unknown")
+            raise RuntimeError(
+                f"All {len(tasks)} beats failed to render or merge. "
+                f"First error: {first[:300]}"
+            )
+        await concat_segments(ordered, output_path)
+
+    # If any stage fails (or the caller is cancelled), stop the other two so
+    # no merge or concat keeps writing after the job is reported failed.
+    stages = [asyncio.create_task(s()) for s in (_render_stage, _merge_stage, _concat_stage)]
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        for t in stages:
+            t.cancel()
+        await asyncio.gather(*stages, return_exceptions=True)
+        raise
+    return merged_map, render_errors, merge_errors
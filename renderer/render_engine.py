@@ -128,31 +128,24 @@ async def render_all_parallel(
     """
     semaphore = asyncio.Semaphore(max_workers)
 
-    async def _render_one(seg_id: str, scene_file: Path, class_name: str, media_dir: Path):
+    async def _render_one(scene_file: Path, class_name: str, media_dir: Path) -> Path:
         async with semaphore:
-            return seg_id, await asyncio.to_thread(
+            return await asyncio.to_thread(
                 render_segment_subprocess,
                 scene_file, class_name, media_dir, quality,
             )
 
-    coros = [_render_one(*t) for t in tasks]
-    results = await asyncio.gather(*coros, return_exceptions=True)
+    # return_exceptions keeps one failed beat from cancelling its siblings;
+    # gather preserves order, so results line up with tasks for attribution.
+    results = await asyncio.gather(*(_render_one(*t[1:]) for t in tasks), return_exceptions=True)
 
     rendered: dict[str, Path] = {}
     errors: dict[str, str] = {}
-    for item in results:
+    for (seg_id, *_), item in zip(tasks, results):
         if isinstance(item, Exception):
-            log.error("Render failed: %s", item)
-            # Extract segment id from the exception message if possible
-            msg = str(item)
-            for seg_id, _, class_name, _ in tasks:
-                if class_name in msg:
-                    errors[seg_id] = msg[:500]
-                    break
-            else:
-                errors[f"unknown_{len(errors)}"] = msg[:500]
-            continue
-        seg_id, mp4_path = item
-        rendered[seg_id] = mp4_path
+            log.error("Render failed for %s: %s", seg_id, item)
+            errors[seg_id] = str(item)[:500]
+        else:
+            rendered[seg_id] = item
 
     return rendered, errors
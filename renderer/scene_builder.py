@@ -10,9 +10,11 @@ Each generated file:
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from pathlib import Path
+from typing import TextIO
 
 # Project root — so generated files can add it to sys.path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -45,7 +47,15 @@ class {class_name}(_BaseClass):
         self.audio_file = _AUDIO_FILE
 '''
 
+# PROJECT_ROOT never changes within a process — resolve it into the template
+# once here so each build_scene_file() call only formats the per-beat fields.
+_SCENE_FILE_TEMPLATE = _SCENE_FILE_TEMPLATE.replace(
+    "{project_root!r}",
+    repr(str(PROJECT_ROOT)).replace("{", "{{").replace("}", "}}"),
+)
 
+
+@functools.lru_cache(maxsize=512)
 def _to_class_name(beat_id: str) -> str:
     """Convert a beat_id to a valid Python class name."""
     clean = re.sub(r"[^a-zA-Z0-9]", "_", beat_id)
@@ -59,8 +69,8 @@ def build_scene_file(
     style: dict,
     total_duration: float,
     audio_path: str | Path | None,
-    output_file: Path,
-) -> tuple[Path, str]:
+    output_file: Path | TextIO,
+) -> tuple[Path | TextIO, str]:
     """
     Write a self-contained Manim .py file for one beat.
 
@@ -69,10 +79,11 @@ def build_scene_file(
         style:          Global style dict {theme, accent_color, ...}.
         total_duration: Exact duration the scene should run (from TTS audio).
         audio_path:     Path to the .wav audio file, or None if no audio.
-        output_file:    Path where the generated .py file will be written.
+        output_file:    Path where the generated .py file will be written, or
+                        a writable text buffer (e.g. io.StringIO) to skip disk.
 
     Returns:
-        (output_file path, scene class name)
+        (output_file path or buffer, scene class name)
     """
     beat_id    = beat_config.get("beat_id", "beat")
     class_name = _to_class_name(beat_id)
@@ -83,7 +94,6 @@ def build_scene_file(
     audio_file_repr = repr(str(audio_path)) if audio_path else repr(None)
 
     source = _SCENE_FILE_TEMPLATE.format(
-        project_root    = str(PROJECT_ROOT),
         beat_json_repr  = repr(beat_json),
         style_json_repr = repr(style_json),
         total_duration  = round(total_duration, 3),
@@ -91,9 +101,14 @@ def build_scene_file(
         class_name      = class_name,
     )
 
+    if hasattr(output_file, "write"):
+        output_file.write(source)
+        return output_file, class_name
+
     output_file = Path(output_file)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(source, encoding="utf-8")
+    # Encode once and write bytes — skips text-mode newline translation.
+    output_file.write_bytes(source.encode("utf-8"))
 
     return output_file, class_name
 
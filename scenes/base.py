@@ -7,6 +7,8 @@ axes helpers, transitions, safe-zone fit helpers, and audio sync.
 
 from __future__ import annotations
 
+import functools
+import re
 from pathlib import Path
 
 from manim import (
@@ -58,6 +60,11 @@ from manim import (
 )
 import numpy as np
 
+try:
+    import re2 as _regex  # google-re2: linear-time DFA matcher, same API as re
+except ImportError:
+    _regex = re
+
 # ── Centralized color resolver ────────────────────────────────────────────────
 # Maps any color name the LLM might produce to a valid Manim color.
 # Case-insensitive. Hex strings (#RRGGBB) are passed through unchanged.
@@ -121,15 +128,40 @@ _TEXT_REPLACEMENTS: list[tuple[str, str]] = [
     ("<-",  "←"),
     ("=>",  "⇒"),
     ("<=>", "⟺"),
+    ("<->", "↔"),   # explicit, else leftmost "<-" would give "←>"
     ("...", "…"),
 ]
 
 
+_TEXT_REPLACEMENT_MAP: dict[str, str] = dict(_TEXT_REPLACEMENTS)
+
+
+def _compile_replacements(patterns) -> re.Pattern[str]:
+    """
+    One alternation over every pattern, longest first, so the text is scanned
+    once and "<=>" wins over its "<=" prefix — single-character patterns
+    included, so a future "-" key can never pre-empt "->" or "<-".
+    Compiled with RE2 when it is installed.
+    """
+    return _regex.compile(
+        "|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+    )
+
+
+_TEXT_REPLACEMENT_RE = _compile_replacements(_TEXT_REPLACEMENT_MAP)
+
+# Every pattern starts with one of these; text containing none of them is
+# returned without touching the regex engine.
+_TEXT_TRIGGER_CHARS: frozenset[str] = frozenset(p[0] for p in _TEXT_REPLACEMENT_MAP)
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Replace common ASCII approximations with proper Unicode characters."""
-    for ascii_form, unicode_char in _TEXT_REPLACEMENTS:
-        text = text.replace(ascii_form, unicode_char)
-    return text
+    # One C-level pass over the (short, on-screen) text; most labels have no trigger.
+    if _TEXT_TRIGGER_CHARS.isdisjoint(text):
+        return text
+    return _TEXT_REPLACEMENT_RE.sub(lambda m: _TEXT_REPLACEMENT_MAP[m.group(0)], text)
 
 
 def resolve_color(name: str | object, fallback=YELLOW) -> object:
@@ -145,12 +177,30 @@ def resolve_color(name: str | object, fallback=YELLOW) -> object:
     """
     if not isinstance(name, str):
         return name  # already a Manim color / array
-    upper = name.strip().upper()
-    if upper in _GLOBAL_COLOR_MAP:
-        return _GLOBAL_COLOR_MAP[upper]
-    if upper.startswith("#") and len(upper) in (7, 9):
+    hit = _COLOR_EXACT.get(name)
+    if hit is not None:
+        return hit
+    resolved = _resolve_color_name(name)
+    return fallback if resolved is None else resolved
+
+
+# Lower-cased once at import so lookups need no per-call key rebuilding.
+_GLOBAL_COLOR_MAP_CI: dict[str, object] = {k.lower(): v for k, v in _GLOBAL_COLOR_MAP.items()}
+# Canonical ("BLUE_C") and lower-case ("blue_c") spellings — what the LLM
+# almost always emits — resolve with one dict probe, before the cached path.
+_COLOR_EXACT: dict[str, object] = {**_GLOBAL_COLOR_MAP, **_GLOBAL_COLOR_MAP_CI}
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_color_name(name: str) -> object | None:
+    """Cached string half of resolve_color; None means "use the fallback"."""
+    key = name.strip().lower()
+    hit = _GLOBAL_COLOR_MAP_CI.get(key)
+    if hit is not None:
+        return hit
+    if key.startswith("#") and len(key) in (7, 9):
         return name  # valid hex — pass through
-    return fallback
+    return None
 
 
 class BaseEngineeringScene(Scene):
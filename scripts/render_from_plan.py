@@ -17,6 +17,7 @@ import json
 import logging
 import sys
 import time
+from operator import itemgetter
 from pathlib import Path
 
 # ── project root on path ──────────────────────────────────────────────────────
@@ -70,11 +71,12 @@ async def run(plan_path: Path, quality: str, max_beats: int | None, job_id: str)
 
     durations:   dict[str, float] = {}
     audio_paths: dict[str, Path]  = {}
+    min_dur = settings.min_beat_duration
     for beat in beats:
         bid      = beat["beat_id"]
         clip     = audio_clips.get(bid)
         tts_dur  = clip.duration if (clip and clip.duration > 0) else 8.0
-        durations[bid]   = max(tts_dur, settings.min_beat_duration)
+        durations[bid]   = tts_dur if tts_dur > min_dur else min_dur
         wav = audio_dir / f"{bid}.wav"
         if wav.exists():
             audio_paths[bid] = wav
@@ -115,7 +117,7 @@ async def run(plan_path: Path, quality: str, max_beats: int | None, job_id: str)
     merged_dir = settings.raw_dir / "merged" / job_id
     merged_dir.mkdir(parents=True, exist_ok=True)
 
-    beat_order  = [b["beat_id"] for b in beats]
+    beat_order  = list(map(itemgetter("beat_id"), beats))
     merge_tasks_coros = []
     for bid in beat_order:
         vp = rendered_map.get(bid)
@@ -0,0 +1,56 @@
+"""
+Unit-test fixtures shared across tests/unit/.
+"""
+
+import importlib.util
+import json
+from types import MappingProxyType
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# The scene registry imports every scene module at collection time; without
+# manim that is a guaranteed ImportError, so skip the file outright.  find_spec
+# avoids paying manim's own import cost just to check for it.
+collect_ignore = []
+if importlib.util.find_spec("manim") is None:
+    collect_ignore.append("test_scene_registry.py")
+
+
+@pytest.fixture(scope="session")
+def scene_builder():
+    """
+    Memoised build_beat_scene(beat, style).
+
+    build_beat_scene bakes every visual field, the beat_id and the narration
+    into the class it returns, so the cache key covers the whole beat — two
+    beats that differ only in e.g. subtitle must not share a class.
+
+    A read-only MappingProxyType style is keyed by identity; it is pinned for
+    the session so its id can never be reused by another object.
+    """
+    from scenes import build_beat_scene
+
+    cache: dict[tuple, type] = {}
+    pinned_styles: dict[int, MappingProxyType] = {}
+
+    def build(beat: dict, style: dict) -> type:
+        if isinstance(style, MappingProxyType):
+            style_key = id(style)
+            pinned_styles.setdefault(style_key, style)
+        else:
+            style_key = tuple(sorted(style.items()))
+        key = (json.dumps(beat, sort_keys=True, default=repr), style_key)
+        cls = cache.get(key)
+        if cls is None:
+            cls = cache[key] = build_beat_scene(beat, style)
+        return cls
+
+    return build
+
+
+@pytest.fixture
+def patch_to_thread():
+    """asyncio.to_thread replaced by an AsyncMock; set return_value / side_effect on it."""
+    with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
+        yield mock_thread
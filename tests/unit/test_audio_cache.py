@@ -0,0 +1,121 @@
+"""
+Unit tests for narration/audio_cache.py
+
+Covers the disk round-trip and the bounded in-memory LRU in front of it.
+Everything runs against a tmp_path cache directory — no network.
+"""
+
+import threading
+
+import pytest
+
+from narration.audio_cache import AudioCache
+from narration.sarvam_client import AudioClip
+
+
+def _clip(text: str = "Hello.", payload: bytes = b"RIFF....WAVE") -> AudioClip:
+    return AudioClip(audio_bytes=payload, duration=1.5, sample_rate=22050, text=text)
+
+
+@pytest.fixture
+def cache(tmp_path) -> AudioCache:
+    return AudioCache(tmp_path / "audio", memory_entries=2)
+
+
+class TestDiskRoundTrip:
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get("Nothing here.", "shubh", "en") is None
+
+    def test_put_then_fresh_instance_reads_from_disk(self, cache):
+        cache.put("Hello.", "shubh", "en", _clip())
+
+        reopened = AudioCache(cache.cache_dir)
+        clip = reopened.get("Hello.", "shubh", "en")
+
+        assert clip is not None
+        assert clip.audio_bytes == b"RIFF....WAVE"
+        assert clip.duration == 1.5
+
+    def test_key_hashed_once_per_text_across_get_and_put(self, cache):
+        AudioCache._compute_key.cache_clear()
+        cache.get("Fresh line.", "shubh", "en")
+        cache.put("Fresh line.", "shubh", "en", _clip())
+
+        info = AudioCache._compute_key.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_voice_and_language_are_part_of_the_key(self, cache):
+        cache.put("Hello.", "shubh", "en", _clip())
+        assert cache.get("Hello.", "meera", "en") is None
+        assert cache.get("Hello.", "shubh", "hi") is None
+
+
+class TestMemoryLRU:
+
+    def test_hit_served_from_memory_without_disk_read(self, cache):
+        stored = _clip()
+        cache.put("Hello.", "shubh", "en", stored)
+        (cache.cache_dir / cache.manifest[cache._compute_key("Hello.", "shubh", "en")]["filename"]).unlink()
+
+        assert cache.get("Hello.", "shubh", "en") is stored
+
+    def test_oldest_entry_evicted_past_capacity(self, cache):
+        for text in ("a", "b", "c"):
+            cache.put(text, "shubh", "en", _clip(text))
+
+        assert len(cache._memory) == 2
+        assert cache._compute_key("a", "shubh", "en") not in cache._memory
+        # Evicted from memory only — still on disk
+        assert cache.get("a", "shubh", "en") is not None
+
+    def test_get_promotes_entry(self, cache):
+        cache.put("a", "shubh", "en", _clip("a"))
+        cache.put("b", "shubh", "en", _clip("b"))
+        cache.get("a", "shubh", "en")          # a becomes most recent
+        cache.put("c", "shubh", "en", _clip("c"))  # evicts b, not a
+
+        assert cache._compute_key("a", "shubh", "en") in cache._memory
+        assert cache._compute_key("b", "shubh", "en") not in cache._memory
+
+    def test_byte_budget_evicts_before_entry_cap(self, tmp_path):
+        cache = AudioCache(tmp_path / "audio", memory_entries=10, memory_bytes=250)
+        for text in ("a", "b", "c"):
+            cache.put(text, "shubh", "en", _clip(text, payload=b"\x00" * 100))
+
+        assert len(cache._memory) == 2
+        assert cache._memory_used == 200
+
+    def test_clip_larger_than_budget_not_kept_in_memory(self, tmp_path):
+        cache = AudioCache(tmp_path / "audio", memory_bytes=50)
+        cache.put("small", "shubh", "en", _clip(payload=b"\x00" * 40))
+        cache.put("huge", "shubh", "en", _clip(payload=b"\x00" * 100))
+
+        assert list(cache._memory) == [cache._compute_key("small", "shubh", "en")]
+        assert cache.get("huge", "shubh", "en").audio_bytes == b"\x00" * 100  # still on disk
+
+    def test_invalidate_and_clear_drop_memory(self, cache):
+        cache.put("a", "shubh", "en", _clip("a"))
+        cache.put("b", "shubh", "en", _clip("b"))
+
+        cache.invalidate("a", "shubh", "en")
+        assert cache.get("a", "shubh", "en") is None
+
+        cache.clear()
+        assert cache.get("b", "shubh", "en") is None
+        assert cache.size == 0
+
+    def test_concurrent_puts_keep_manifest_consistent(self, cache):
+        def put_many(prefix: str) -> None:
+            for i in range(20):
+                cache.put(f"{prefix}{i}", "shubh", "en", _clip())
+
+        threads = [threading.Thread(target=put_many, args=(p,)) for p in "xyz"]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert cache.size == 60
+        assert AudioCache(cache.cache_dir).size == 60
+        assert len(cache._memory) == 2
@@ -70,31 +70,31 @@ class TestBeatListStructure:
         errors = validate_beats([beat])
         assert errors == []
 
-    def test_single_beat_fixture_validates(self):
+    def test_single_beat_fixture_validates(self, beats_fixture):
         """single_beat.json fixture validates with zero errors."""
-        beats = json.loads((FIXTURES / "single_beat.json").read_text())
+        beats = beats_fixture("single_beat.json")
         errors = validate_beats(beats)
         assert errors == []
 
-    def test_valid_all_types_fixture_validates(self):
+    def test_valid_all_types_fixture_validates(self, beats_fixture):
         """valid_all_types.json — all 14 beat types validate cleanly."""
-        beats = json.loads((FIXTURES / "valid_all_types.json").read_text())
+        beats = beats_fixture("valid_all_types.json")
         errors = validate_beats(beats)
         assert errors == [], f"Unexpected errors: {errors}"
 
-    def test_valid_all_types_has_14_beats(self):
+    def test_valid_all_types_has_14_beats(self, beats_fixture):
         """valid_all_types.json has exactly 14 beats (one per visual type)."""
-        beats = json.loads((FIXTURES / "valid_all_types.json").read_text())
+        beats = beats_fixture("valid_all_types.json")
         assert len(beats) == 14
 
-    def test_many_beats_fixture_validates(self):
+    def test_many_beats_fixture_validates(self, beats_fixture):
         """many_beats.json (22 beats) validates cleanly."""
-        beats = json.loads((FIXTURES / "many_beats.json").read_text())
+        beats = beats_fixture("many_beats.json")
         errors = validate_beats(beats)
         assert errors == []
 
-    def test_many_beats_fixture_has_22_beats(self):
-        beats = json.loads((FIXTURES / "many_beats.json").read_text())
+    def test_many_beats_fixture_has_22_beats(self, beats_fixture):
+        beats = beats_fixture("many_beats.json")
         assert len(beats) == 22
 
     def test_duplicate_beat_ids_reported(self):
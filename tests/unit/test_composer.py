@@ -7,15 +7,16 @@ patched at the `renderer.composer._vc` level after import.
 """
 
 import asyncio
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 # renderer.composer creates _vc = VideoComposer() at import time.
 # If FFmpeg is not installed VideoComposer.__init__ may raise; guard here.
 try:
-    from renderer.composer import concat_segments, merge_segment
+    from renderer.composer import concat_segments, merge_segment, pipeline, render_full
     _IMPORT_OK = True
 except Exception:
     _IMPORT_OK = False
@@ -186,3 +187,239 @@ class TestConcatSegments:
             result = await concat_segments(paths, output_path=output)
 
         mock_vc.concatenate.assert_called_once()
+
+
+# ── render_full ──────────────────────────────────────────────────────────────
+
+class TestRenderFull:
+
+    async def test_empty_list_raises_value_error(self, tmp_path):
+        with pytest.raises(ValueError, match="No segments"):
+            await render_full([], output_path=tmp_path / "out.mp4")
+
+    async def test_delegates_pairs_in_order(self, tmp_path):
+        v1, v2 = tmp_path / "a.mp4", tmp_path / "b.mp4"
+        a1, a2 = _fake_audio(tmp_path / "a.wav"), _fake_audio(tmp_path / "b.wav")
+        output = tmp_path / "final.mp4"
+
+        mock_vc = MagicMock()
+        mock_vc.render_full.return_value = output
+
+        with patch("renderer.composer._vc", mock_vc):
+            result = await render_full([(v1, a1), (v2, a2)], output_path=output)
+
+        mock_vc.render_full.assert_called_once_with([(v1, a1), (v2, a2)], output)
+        assert result == output
+
+    async def test_missing_audio_passed_as_none(self, tmp_path):
+        video  = tmp_path / "a.mp4"
+        ghost  = tmp_path / "does_not_exist.wav"   # intentionally absent
+        output = tmp_path / "final.mp4"
+
+        mock_vc = MagicMock()
+        with patch("renderer.composer._vc", mock_vc):
+            await render_full([(video, ghost), (video, None)], output_path=output)
+
+        assert mock_vc.render_full.call_args[0][0] == [(video, None), (video, None)]
+
+
+# ── pipeline (render → merge → concat) ───────────────────────────────────────
+
+def _render_tasks(tmp_path: Path, *seg_ids: str) -> list[tuple]:
+    return [(sid, tmp_path / f"{sid}.py", f"Scene_{sid}", tmp_path / "media" / sid) for sid in seg_ids]
+
+
+def _fake_render(failing: tuple = (), slow: tuple = ()):
+    """render_segment_subprocess stand-in: raise for `failing`, sleep for `slow`."""
+    def render(scene_file, class_name, media_dir, quality):
+        sid = class_name.removeprefix("Scene_")
+        if sid in slow:
+            time.sleep(0.05)
+        if sid in failing:
+            raise RuntimeError(f"Manim render failed for '{class_name}'")
+        return media_dir / f"{sid}.mp4"
+    return render
+
+
+async def _fake_merge(video, audio, out):
+    return out
+
+
+class TestPipeline:
+
+    async def test_concat_follows_task_order_not_render_order(self, tmp_path):
+        concat = AsyncMock()
+        with patch("renderer.composer.render_segment_subprocess", _fake_render(slow=("b1",))), \
+             patch("renderer.composer.merge_segment", _fake_merge), \
+             patch("renderer.composer.concat_segments", concat):
+            merged_map, render_errors, merge_errors = await pipeline(
+                _render_tasks(tmp_path, "b1", "b2", "b3"), {}, tmp_path / "merged", tmp_path / "final.mp4",
+            )
+
+        assert render_errors == merge_errors == {}
+        assert set(merged_map) == {"b1", "b2", "b3"}
+        ordered = concat.call_args[0][0]
+        assert [p.name for p in ordered] == ["b1_merged.mp4", "b2_merged.mp4", "b3_merged.mp4"]
+
+    async def test_render_and_merge_failures_reported_others_kept(self, tmp_path):
+        async def merge(video, audio, out):
+            if "b3" in out.name:
+                raise RuntimeError("FFmpeg merge failed: b3")
+            return out
+
+        concat = AsyncMock()
+        with patch("renderer.composer.render_segment_subprocess", _fake_render(failing=("b2",))), \
+             patch("renderer.composer.merge_segment", merge), \
+             patch("renderer.composer.concat_segments", concat):
+            merged_map, render_errors, merge_errors = await pipeline(
+                _render_tasks(tmp_path, "b1", "b2", "b3"), {}, tmp_path / "merged", tmp_path / "final.mp4",
+            )
+
+        assert set(merged_map) == {"b1"}
+        assert set(render_errors) == {"b2"}
+        assert set(merge_errors) == {"b3"}
+        concat.assert_awaited_once()
+
+    async def test_audio_path_passed_to_merge(self, tmp_path):
+        audio = _fake_audio(tmp_path / "b1.wav")
+        merge = AsyncMock(side_effect=_fake_merge)
+        with patch("renderer.composer.render_segment_subprocess", _fake_render()), \
+             patch("renderer.composer.merge_segment", merge), \
+             patch("renderer.composer.concat_segments", AsyncMock()):
+            await pipeline(
+                _render_tasks(tmp_path, "b1", "b2"), {"b1": audio}, tmp_path / "merged", tmp_path / "final.mp4",
+            )
+
+        audio_by_video = {c.args[0].stem: c.args[1] for c in merge.await_args_list}
+        assert audio_by_video == {"b1": audio, "b2": None}
+
+    async def test_all_beats_fail_raises_without_concat(self, tmp_path):
+        concat = AsyncMock()
+        with patch("renderer.composer.render_segment_subprocess", _fake_render(failing=("b1", "b2"))), \
+             patch("renderer.composer.merge_segment", _fake_merge), \
+             patch("renderer.composer.concat_segments", concat):
+            with pytest.raises(RuntimeError, match="All 2 beats failed to render or merge"):
+                await pipeline(
+                    _render_tasks(tmp_path, "b1", "b2"), {}, tmp_path / "merged", tmp_path / "final.mp4",
+                )
+
+        concat.assert_not_awaited()
+
+    async def test_all_merges_fail_raises_merge_error(self, tmp_path):
+        async def merge(video, audio, out):
+            raise RuntimeError(f"FFmpeg merge failed: {out.name}")
+
+        concat = AsyncMock()
+        with patch("renderer.composer.render_segment_subprocess", _fake_render()), \
+             patch("renderer.composer.merge_segment", merge), \
+             patch("renderer.composer.concat_segments", concat):
+            with pytest.raises(RuntimeError, match="failed to render or merge.*FFmpeg merge failed"):
+                await pipeline(
+                    _render_tasks(tmp_path, "b1", "b2"), {}, tmp_path / "merged", tmp_path / "final.mp4",
+                )
+
+        concat.assert_not_awaited()
+
+    async def test_merges_run_concurrently_up_to_max_workers(self, tmp_path):
+        in_flight = peak = 0
+
+        async def merge(video, audio, out):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return out
+
+        with patch("renderer.composer.render_segment_subprocess", _fake_render()), \
+             patch("renderer.composer.merge_segment", merge), \
+             patch("renderer.composer.concat_segments", AsyncMock()):
+            await pipeline(
+                _render_tasks(tmp_path, "b1", "b2", "b3", "b4", "b5"), {},
+                tmp_path / "merged", tmp_path / "final.mp4", max_workers=2,
+            )
+
+        assert peak == 2
+
+    async def test_on_composing_awaited_once_after_renders(self, tmp_path):
+        rendered: list[str] = []
+        render = _fake_render(failing=("b2",))
+
+        def recording_render(scene_file, class_name, media_dir, quality):
+            rendered.append(class_name)
+            return render(scene_file, class_name, media_dir, quality)
+
+        seen_at_compose: list[tuple[int, set]] = []
+
+        async def on_composing(render_errors):
+            seen_at_compose.append((len(rendered), set(render_errors)))
+
+        with patch("renderer.composer.render_segment_subprocess", recording_render), \
+             patch("renderer.composer.merge_segment", _fake_merge), \
+             patch("renderer.composer.concat_segments", AsyncMock()):
+            await pipeline(
+                _render_tasks(tmp_path, "b1", "b2", "b3"), {},
+                tmp_path / "merged", tmp_path / "final.mp4", on_composing=on_composing,
+            )
+
+        assert seen_at_compose == [(3, {"b2"})]
+
+    async def test_on_composing_error_does_not_abort_pipeline(self, tmp_path):
+        async def on_composing(render_errors):
+            raise ConnectionError("job store unavailable")
+
+        concat = AsyncMock()
+        with patch("renderer.composer.render_segment_subprocess", _fake_render()), \
+             patch("renderer.composer.merge_segment", _fake_merge), \
+             patch("renderer.composer.concat_segments", concat):
+            merged_map, _, _ = await pipeline(
+                _render_tasks(tmp_path, "b1", "b2"), {},
+                tmp_path / "merged", tmp_path / "final.mp4", on_composing=on_composing,
+            )
+
+        assert set(merged_map) == {"b1", "b2"}
+        concat.assert_awaited_once()
+
+    async def test_cancelled_pipeline_cancels_in_flight_merges(self, tmp_path):
+        merge_cancelled = asyncio.Event()
+
+        async def merge(video, audio, out):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                merge_cancelled.set()
+                raise
+            return out
+
+        concat = AsyncMock()
+        # b2 still rendering → the merge stage is parked on the queue, not in gather
+        with patch("renderer.composer.render_segment_subprocess", _fake_render(slow=("b2",))), \
+             patch("renderer.composer.merge_segment", merge), \
+             patch("renderer.composer.concat_segments", concat):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    pipeline(_render_tasks(tmp_path, "b1", "b2"), {}, tmp_path / "merged", tmp_path / "final.mp4"),
+                    timeout=0.02,
+                )
+
+        assert merge_cancelled.is_set()
+        concat.assert_not_awaited()
+
+
+# ── VideoComposer singleton ──────────────────────────────────────────────────
+
+class TestGetVc:
+
+    async def test_video_composer_constructed_once_across_merges(self, tmp_path):
+        """FFmpeg is probed once per process, not once per beat."""
+        with patch("renderer.composer._vc", None), \
+             patch("renderer.composer.VideoComposer") as vc_cls:
+            for i in range(3):
+                await merge_segment(
+                    _fake_video(tmp_path / f"v{i}.mp4"),
+                    _fake_audio(tmp_path / f"a{i}.wav"),
+                    tmp_path / f"out{i}.mp4",
+                )
+
+        vc_cls.assert_called_once_with()
+        assert vc_cls.return_value.merge_segment.call_count == 3
@@ -2,24 +2,72 @@
 Unit tests for tts/sarvam.py
 
 SarvamTTS SDK and AudioCache are fully mocked — no API calls, no network.
-pydub-dependent tests are skipped automatically when pydub is not installed.
+Silence trimming of 16-bit PCM is pure NumPy; only the pydub fallback needs pydub.
 """
 
 import asyncio
 import io
 import struct
+import threading
+import time
 import wave
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
-from narration.sarvam_client import AudioClip
-from tts.sarvam import _trim_silence, generate_all_audio, generate_audio_async
+try:
+    from numba import njit
+except ImportError:  # numba is optional — NumPy path below is the fallback
+    njit = None
+
+from narration.audio_cache import AudioCache
+from narration.sarvam_client import AudioClip, SarvamTTS
+from tts.sarvam import (
+    _trim_silence,
+    _trim_silence_pydub,
+    _tts_workers,
+    _write_wav,
+    generate_all_audio,
+    generate_audio_async,
+)
 
 
 # ── Local WAV helpers ────────────────────────────────────────────────────────
 
+def _square_fill_np(out: np.ndarray, amp: int) -> None:
+    """Fill out with a square wave: +amp for 50 samples, -amp for 50."""
+    out[:] = np.where(np.arange(out.size) % 100 < 50, amp, -amp)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _square_fill(out, amp):
+        for i in range(out.size):
+            out[i] = amp if (i % 100) < 50 else -amp
+else:
+    _square_fill = _square_fill_np
+
+
+def _square_wave_bytes(num_frames: int, amplitude: int) -> bytes:
+    """16-bit little-endian PCM for a square wave of num_frames samples."""
+    out = np.empty(num_frames, dtype="<i2")
+    _square_fill(out, amplitude)
+    return out.tobytes()
+
+
+_SILENCE_CACHE: dict[int, bytes] = {}
+
+
+def _silence(num_frames: int) -> bytes:
+    """16-bit PCM silence of num_frames samples, memoised by length."""
+    data = _SILENCE_CACHE.get(num_frames)
+    if data is None:
+        data = _SILENCE_CACHE[num_frames] = b"\x00\x00" * num_frames
+    return data
+
+
 def _make_wav(duration_s: float = 1.0, sample_rate: int = 22050, amplitude: int = 0) -> bytes:
     num_frames = int(sample_rate * duration_s)
     buf = io.BytesIO()
@@ -28,13 +76,9 @@ def _make_wav(duration_s: float = 1.0, sample_rate: int = 22050, amplitude: int
         wf.setsampwidth(2)
         wf.setframerate(sample_rate)
         if amplitude == 0:
-            wf.writeframes(b"\x00\x00" * num_frames)
+            wf.writeframes(_silence(num_frames))
         else:
-            data = b""
-            for i in range(num_frames):
-                val = amplitude if (i % 100) < 50 else -amplitude
-                data += struct.pack("<h", val)
-            wf.writeframes(data)
+            wf.writeframes(_square_wave_bytes(num_frames, amplitude))
     return buf.getvalue()
 
 
@@ -55,13 +99,9 @@ def _make_padded_wav(
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(sample_rate)
-        wf.writeframes(b"\x00\x00" * before_frames)
-        data = b""
-        for i in range(content_frames):
-            val = amplitude if (i % 100) < 50 else -amplitude
-            data += struct.pack("<h", val)
-        wf.writeframes(data)
-        wf.writeframes(b"\x00\x00" * after_frames)
+        wf.writeframes(_silence(before_frames))
+        wf.writeframes(_square_wave_bytes(content_frames, amplitude))
+        wf.writeframes(_silence(after_frames))
     return buf.getvalue()
 
 
@@ -84,7 +124,6 @@ class TestTrimSilence:
         assert result is clip
 
     def test_silence_padding_trimmed_reduces_duration(self):
-        pytest.importorskip("pydub", reason="pydub not installed")
         padded = _make_padded_wav(before_ms=300, content_ms=1000, after_ms=300)
         total_dur = 1.6  # 300 + 1000 + 300 ms
         clip = AudioClip(audio_bytes=padded, duration=total_dur, sample_rate=22050, text="t")
@@ -97,7 +136,6 @@ class TestTrimSilence:
         assert trimmed.duration > 0.5
 
     def test_all_silent_clip_returns_original(self):
-        pytest.importorskip("pydub", reason="pydub not installed")
         silent = _make_wav(duration_s=1.0, amplitude=0)
         clip = AudioClip(audio_bytes=silent, duration=1.0, sample_rate=22050, text="t")
 
@@ -106,15 +144,80 @@ class TestTrimSilence:
         # No non-silent ranges → fall-through → original returned
         assert result.audio_bytes == clip.audio_bytes
 
-    def test_pydub_import_error_returns_original(self):
-        """When pydub is unavailable the function falls back gracefully."""
-        clip = _make_clip(3.0)
+    def test_16bit_pcm_trimmed_without_pydub(self):
+        """Sarvam's 16-bit WAVs never touch pydub."""
+        padded = _make_padded_wav(before_ms=300, content_ms=1000, after_ms=300)
+        clip = AudioClip(audio_bytes=padded, duration=1.6, sample_rate=22050, text="t")
         with patch.dict("sys.modules", {"pydub": None, "pydub.silence": None}):
             result = _trim_silence(clip)
-        assert result is clip
+        assert 1.0 < result.duration < 1.6
+        assert result.audio_bytes[:4] == b"RIFF"
+
+    def test_trimmed_wav_payload_is_exact_slice_of_source(self):
+        padded = _make_padded_wav(before_ms=300, content_ms=1000, after_ms=300)
+        clip = AudioClip(audio_bytes=padded, duration=1.6, sample_rate=22050, text="t")
+
+        result = _trim_silence(clip)
+
+        with wave.open(io.BytesIO(padded), "rb") as src, wave.open(io.BytesIO(result.audio_bytes), "rb") as out:
+            kept = out.readframes(out.getnframes())
+            assert out.getparams()[:3] == src.getparams()[:3]
+            assert kept in src.readframes(src.getnframes())
+
+    def test_raw_pcm_trimmed_and_wrapped_as_wav(self):
+        pcm = _silence(6615) + _square_wave_bytes(22050, 8000) + _silence(6615)
+        clip = AudioClip(audio_bytes=pcm, duration=1.6, sample_rate=22050, text="t")
+
+        result = _trim_silence(clip)
+
+        assert result.audio_bytes[:4] == b"RIFF"
+        with wave.open(io.BytesIO(result.audio_bytes), "rb") as wf:
+            assert wf.getnframes() / wf.getframerate() == pytest.approx(result.duration)
+        assert 1.0 < result.duration < 1.6
+
+    def test_short_clip_below_threshold_not_trimmed(self):
+        padded = _make_padded_wav(before_ms=300, content_ms=600, after_ms=300)
+        clip = AudioClip(audio_bytes=padded, duration=1.2, sample_rate=22050, text="t")
+
+        assert _trim_silence(clip) is clip
+
+        with patch("tts.sarvam.settings.tts_trim_min_duration", 0.5):
+            assert _trim_silence(clip).duration < 1.2
+
+    def test_float_wav_routed_to_pydub_fallback(self):
+        """wave cannot parse IEEE-float WAVs; they must reach pydub, not the failure path."""
+        data = np.zeros(44100, dtype="<f4").tobytes()
+        fmt = struct.pack("<HHIIHH", 3, 1, 22050, 22050 * 4, 4, 32)
+        float_wav = (
+            b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(data)) + b"WAVE"
+            + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"data" + struct.pack("<I", len(data)) + data
+        )
+        clip = AudioClip(audio_bytes=float_wav, duration=2.0, sample_rate=22050, text="t")
+
+        with patch("tts.sarvam._trim_silence_pydub", return_value=clip) as fallback:
+            assert _trim_silence(clip) is clip
+        fallback.assert_called_once_with(clip)
+
+    def test_pydub_fallback_skipped_when_unavailable(self):
+        clip = _make_clip(1.0, amplitude=8000)
+        with patch("tts.sarvam._PYDUB_AVAILABLE", False):
+            assert _trim_silence_pydub(clip) is clip
+
+    def test_non_16bit_wav_uses_pydub_fallback(self):
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(1)
+            wf.setframerate(22050)
+            wf.writeframes(b"\x80" * 44100)
+        clip = AudioClip(audio_bytes=buf.getvalue(), duration=2.0, sample_rate=22050, text="t")
+
+        with patch("tts.sarvam._trim_silence_pydub", return_value=clip) as fallback:
+            assert _trim_silence(clip) is clip
+        fallback.assert_called_once_with(clip)
 
     def test_trimmed_result_has_nonempty_audio_bytes(self):
-        pytest.importorskip("pydub", reason="pydub not installed")
         padded = _make_padded_wav()
         clip = AudioClip(audio_bytes=padded, duration=1.4, sample_rate=22050, text="t")
 
@@ -123,7 +226,6 @@ class TestTrimSilence:
         assert len(trimmed.audio_bytes) > 0
 
     def test_clean_audio_not_over_trimmed(self):
-        pytest.importorskip("pydub", reason="pydub not installed")
         pure = _make_wav(duration_s=1.0, amplitude=8000)
         clip = AudioClip(audio_bytes=pure, duration=1.0, sample_rate=22050, text="t")
 
@@ -131,18 +233,24 @@ class TestTrimSilence:
 
         assert trimmed.duration > 0
 
+    def test_untrimmable_clip_returned_without_reencode(self):
+        pure = _make_wav(duration_s=1.0, amplitude=8000)
+        clip = AudioClip(audio_bytes=pure, duration=1.0, sample_rate=22050, text="t")
+
+        assert _trim_silence(clip) is clip
+
 
 # ── generate_audio_async ─────────────────────────────────────────────────────
 
 class TestGenerateAudioAsync:
 
-    def _tts(self, text: str = "Hello.", duration: float = 3.0) -> MagicMock:
-        tts = MagicMock()
+    def _tts(self, text: str = "Hello.", duration: float = 3.0) -> Mock:
+        tts = Mock(spec=SarvamTTS)
         tts.generate.return_value = _make_clip(duration, text=text)
         return tts
 
-    def _cache(self, cached: AudioClip | None = None) -> MagicMock:
-        c = MagicMock()
+    def _cache(self, cached: AudioClip | None = None) -> Mock:
+        c = Mock(spec=AudioCache)
         c.get.return_value = cached
         return c
 
@@ -200,6 +308,54 @@ class TestGenerateAudioAsync:
         _, kwargs = cache.put.call_args
         assert kwargs["clip"] is trimmed
 
+    async def test_tts_runs_on_shared_bounded_executor(self):
+        tts   = self._tts()
+        cache = self._cache(None)
+        seen: list[str] = []
+        tts.generate.side_effect = lambda text, lang: seen.append(threading.current_thread().name) or _make_clip()
+
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
+            await generate_audio_async("Hello.", "shubh", "en", tts, cache)
+
+        assert seen and seen[0].startswith("sarvam-tts")
+
+    @pytest.mark.parametrize("configured,cpus,expected", [
+        pytest.param(None, 16, 4, id="auto_capped"),
+        pytest.param(None, 2, 2, id="auto_few_cpus"),
+        pytest.param(8, 2, 8, id="explicit_setting_wins"),
+    ])
+    def test_tts_worker_count(self, configured, cpus, expected):
+        with patch("tts.sarvam.settings.tts_concurrency", configured), \
+             patch("tts.sarvam.os.sched_getaffinity", return_value=set(range(cpus)), create=True):
+            assert _tts_workers() == expected
+
+    async def test_trim_runs_off_the_event_loop_thread(self):
+        tts   = self._tts()
+        cache = self._cache(None)
+        loop_thread = threading.current_thread()
+        seen: list[threading.Thread] = []
+
+        def trim(clip):
+            seen.append(threading.current_thread())
+            return clip
+
+        with patch("tts.sarvam._trim_silence", side_effect=trim):
+            await generate_audio_async("Hello.", "shubh", "en", tts, cache)
+
+        assert seen and seen[0] is not loop_thread
+
+    async def test_cache_put_runs_off_the_event_loop_thread(self):
+        tts   = self._tts()
+        cache = self._cache(None)
+        loop_thread = threading.current_thread()
+        put_threads: list[threading.Thread] = []
+        cache.put.side_effect = lambda **kw: put_threads.append(threading.current_thread())
+
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
+            await generate_audio_async("Hello.", "shubh", "en", tts, cache)
+
+        assert put_threads and put_threads[0] is not loop_thread
+
     async def test_cache_not_called_after_hit(self):
         """On cache hit, cache.put is never invoked."""
         cached = _make_clip(2.0)
@@ -213,19 +369,31 @@ class TestGenerateAudioAsync:
 
 # ── generate_all_audio ───────────────────────────────────────────────────────
 
+@pytest.fixture(scope="module")
+def audio_dir(tmp_path_factory) -> Path:
+    """One directory for the whole module — avoids per-test mkdir/teardown."""
+    return tmp_path_factory.mktemp("audio")
+
+
+@pytest.fixture
+def beat_dir(audio_dir, request) -> Path:
+    """Per-test subdirectory of the shared audio_dir so writes never collide."""
+    return audio_dir / request.node.name
+
+
 class TestGenerateAllAudio:
 
-    def _tts(self) -> MagicMock:
-        tts = MagicMock()
+    def _tts(self) -> Mock:
+        tts = Mock(spec=SarvamTTS)
         tts.generate.return_value = _make_clip(3.0)
         return tts
 
-    def _cache(self) -> MagicMock:
-        c = MagicMock()
+    def _cache(self) -> Mock:
+        c = Mock(spec=AudioCache)
         c.get.return_value = None
         return c
 
-    async def test_all_beats_in_result(self, tmp_path):
+    async def test_all_beats_in_result(self, beat_dir):
         beats = [
             {"beat_id": "intro_1",   "narration": "Hello."},
             {"beat_id": "def_1",     "narration": "The equation."},
@@ -233,18 +401,18 @@ class TestGenerateAllAudio:
         ]
         with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
             result = await generate_all_audio(
-                beats, "shubh", "en", self._tts(), self._cache(), tmp_path
+                beats, "shubh", "en", self._tts(), self._cache(), beat_dir
             )
 
         assert set(result.keys()) == {"intro_1", "def_1", "summary_1"}
 
-    async def test_failed_beat_excluded_others_present(self, tmp_path):
+    async def test_failed_beat_excluded_others_present(self, beat_dir):
         beats = [
             {"beat_id": "intro_1",   "narration": "Hello."},
             {"beat_id": "bad_1",     "narration": "This will fail."},
             {"beat_id": "summary_1", "narration": "That is all."},
         ]
-        tts = MagicMock()
+        tts = Mock(spec=SarvamTTS)
         cache = self._cache()
 
         def tts_generate(text, lang):
@@ -256,25 +424,124 @@ class TestGenerateAllAudio:
 
         with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
             result = await generate_all_audio(
-                beats, "shubh", "en", tts, cache, tmp_path
+                beats, "shubh", "en", tts, cache, beat_dir
             )
 
         assert "intro_1"   in result
         assert "bad_1"     not in result   # failed
         assert "summary_1" in result
 
-    async def test_audio_wav_files_written_to_disk(self, tmp_path):
+    async def test_audio_wav_files_written_to_disk(self, beat_dir):
         beats = [
             {"beat_id": "intro_1", "narration": "Hello."},
             {"beat_id": "def_1",   "narration": "The equation."},
         ]
         with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
             await generate_all_audio(
-                beats, "shubh", "en", self._tts(), self._cache(), tmp_path
+                beats, "shubh", "en", self._tts(), self._cache(), beat_dir
             )
 
-        assert (tmp_path / "intro_1.wav").exists()
-        assert (tmp_path / "def_1.wav").exists()
+        assert (beat_dir / "intro_1.wav").exists()
+        assert (beat_dir / "def_1.wav").exists()
+
+    async def test_repeated_narration_synthesised_once(self, beat_dir):
+        beats = [
+            {"beat_id": "a_1", "narration": "Let's think again."},
+            {"beat_id": "b_1", "narration": "Something new."},
+            {"beat_id": "c_1", "narration": "  Let's think again. "},
+        ]
+        tts   = self._tts()
+        cache = self._cache()
+
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
+            result = await generate_all_audio(beats, "shubh", "en", tts, cache, beat_dir)
+
+        assert tts.generate.call_count == 2
+        assert cache.get.call_count == 2
+        assert result["a_1"] is result["c_1"]
+        assert (beat_dir / "a_1.wav").exists() and (beat_dir / "c_1.wav").exists()
+
+    async def test_repeated_beat_id_keeps_last_narration(self, beat_dir):
+        beats = [
+            {"beat_id": "dup_1", "narration": "First take."},
+            {"beat_id": "one_1", "narration": "Between."},
+            {"beat_id": "dup_1", "narration": "Second take."},
+        ]
+        tts = Mock(spec=SarvamTTS)
+        tts.generate.side_effect = lambda text, lang: _make_clip(3.0, text=text)
+
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c), \
+             patch("tts.sarvam._write_wav") as write_wav:
+            result = await generate_all_audio(beats, "shubh", "en", tts, self._cache(), beat_dir)
+
+        assert result["dup_1"].text == "Second take."
+        assert [c.args[0].name for c in write_wav.call_args_list].count("dup_1.wav") == 1
+
+    async def test_result_in_beat_order_not_resolution_order(self, beat_dir):
+        beats = [
+            {"beat_id": "miss_1", "narration": "Fresh."},
+            {"beat_id": "hit_1",  "narration": "Cached."},
+        ]
+        cache = self._cache()
+        cache.get.side_effect = lambda text, voice, language: _make_clip(2.0) if text == "Cached." else None
+
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
+            result = await generate_all_audio(beats, "shubh", "en", self._tts(), cache, beat_dir)
+
+        assert list(result) == ["miss_1", "hit_1"]
+
+    async def test_cached_wav_written_while_misses_synthesise(self, beat_dir):
+        beats = [
+            {"beat_id": "hit_1",  "narration": "Cached."},
+            {"beat_id": "miss_1", "narration": "Fresh."},
+        ]
+        cache = self._cache()
+        cache.get.side_effect = lambda text, voice, language: _make_clip(2.0) if text == "Cached." else None
+        hit_wav = beat_dir / "hit_1.wav"
+        written_before_miss: list[bool] = []
+
+        def slow_generate(text, lang):
+            for _ in range(100):  # wait (≤1 s) for the cache hit's write to land
+                if hit_wav.exists():
+                    break
+                time.sleep(0.01)
+            written_before_miss.append(hit_wav.exists())
+            return _make_clip(3.0, text=text)
+
+        tts = Mock(spec=SarvamTTS)
+        tts.generate.side_effect = slow_generate
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
+            await generate_all_audio(beats, "shubh", "en", tts, cache, beat_dir)
+
+        assert written_before_miss == [True]
+        assert (beat_dir / "miss_1.wav").exists()
+
+    async def test_wav_writes_run_on_dedicated_io_pool(self, beat_dir):
+        threads: list[str] = []
+
+        def recording_write(path, clip):
+            threads.append(threading.current_thread().name)
+            _write_wav(path, clip)
+
+        beats = [{"beat_id": "io_1", "narration": "Hello."}]
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c), \
+             patch("tts.sarvam._write_wav", side_effect=recording_write):
+            await generate_all_audio(beats, "shubh", "en", self._tts(), self._cache(), beat_dir)
+
+        assert threads and threads[0].startswith("tts-io")
+
+    async def test_raw_pcm_written_as_wav_container(self, beat_dir):
+        pcm = _square_wave_bytes(2205, 8000)
+        tts = Mock(spec=SarvamTTS)
+        tts.generate.return_value = AudioClip(audio_bytes=pcm, duration=0.1, sample_rate=22050, text="Hi.")
+        beats = [{"beat_id": "pcm_1", "narration": "Hi."}]
+
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
+            await generate_all_audio(beats, "shubh", "en", tts, self._cache(), beat_dir)
+
+        with wave.open(str(beat_dir / "pcm_1.wav"), "rb") as wf:
+            assert wf.getframerate() == 22050
+            assert wf.readframes(wf.getnframes()) == pcm
 
     async def test_audio_dir_created_when_missing(self, tmp_path):
         audio_dir = tmp_path / "brand_new_dir"
@@ -287,7 +554,7 @@ class TestGenerateAllAudio:
 
         assert audio_dir.exists()
 
-    async def test_empty_narration_beat_not_saved_to_disk(self, tmp_path):
+    async def test_empty_narration_beat_not_saved_to_disk(self, beat_dir):
         """
         Beats with empty narration produce an empty AudioClip
         (audio_bytes == b'') so no .wav file is written.
@@ -295,16 +562,33 @@ class TestGenerateAllAudio:
         beats = [{"beat_id": "silent_1", "narration": ""}]
 
         result = await generate_all_audio(
-            beats, "shubh", "en", self._tts(), self._cache(), tmp_path
+            beats, "shubh", "en", self._tts(), self._cache(), beat_dir
         )
 
-        assert not (tmp_path / "silent_1.wav").exists()
+        assert not (beat_dir / "silent_1.wav").exists()
+
+    async def test_only_cache_misses_reach_tts(self, beat_dir):
+        beats = [
+            {"beat_id": "hit_1",  "narration": "Cached."},
+            {"beat_id": "miss_1", "narration": "Fresh."},
+            {"beat_id": "blank",  "narration": "  "},
+        ]
+        cache = self._cache()
+        cache.get.side_effect = lambda text, voice, language: _make_clip(2.0) if text == "Cached." else None
+        tts = self._tts()
+
+        with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
+            result = await generate_all_audio(beats, "shubh", "en", tts, cache, beat_dir)
+
+        tts.generate.assert_called_once_with("Fresh.", "en")
+        assert set(result) == {"hit_1", "miss_1", "blank"}
+        assert (beat_dir / "hit_1.wav").exists()
 
-    async def test_returns_dict_keyed_by_beat_id(self, tmp_path):
+    async def test_returns_dict_keyed_by_beat_id(self, beat_dir):
         beats = [{"beat_id": "x_1", "narration": "Hello."}]
         with patch("tts.sarvam._trim_silence", side_effect=lambda c: c):
             result = await generate_all_audio(
-                beats, "shubh", "en", self._tts(), self._cache(), tmp_path
+                beats, "shubh", "en", self._tts(), self._cache(), beat_dir
             )
 
         assert "x_1" in result
@@ -2,281 +2,194 @@
 Unit tests for renderer/scene_builder.py
 
 All tests are pure Python — no Manim, no subprocesses, no API calls.
+
+Every test writes into its own tmp_path / tmp_path_factory directory, so the
+module is safe under pytest-xdist.  Use --dist=loadscope so each worker keeps
+the module/session-scoped scene fixtures warm:
+
+    pytest tests/unit/test_scene_builder.py -p xdist.plugin -n auto --dist=loadscope
+
+Set MATHVIZ_SKIP_PYCOMPILE=1 to skip the compile-only sanity checks while
+iterating on a focused subset (CI should leave it unset):
+
+    MATHVIZ_SKIP_PYCOMPILE=1 pytest tests/unit/test_scene_builder.py -k identifier
 """
 
-import json
-import py_compile
+import ast
+import io
+import os
+import re
+from collections import namedtuple
 from pathlib import Path
 
 import pytest
 
 from renderer.scene_builder import (
+    PROJECT_ROOT,
     _to_class_name,
     build_all_scene_files,
     build_scene_file,
 )
 
 
+_SKIP_COMPILE = os.environ.get("MATHVIZ_SKIP_PYCOMPILE") == "1"
+skip_compile = pytest.mark.skipif(_SKIP_COMPILE, reason="MATHVIZ_SKIP_PYCOMPILE=1 (fast mode)")
+
+
 # ── Sample beats for all supported visual types ──────────────────────────────
 
-ALL_BEAT_TYPES = [
-    pytest.param(
-        {
-            "beat_id": "intro_1",
-            "narration": "Welcome to the lesson.",
-            "visual": {"type": "title_card", "title": "Introduction", "subtitle": "Getting started"},
-        },
-        id="title_card",
-    ),
-    pytest.param(
-        {
-            "beat_id": "def_1",
-            "narration": "The famous energy equation.",
-            "visual": {"type": "equation_reveal", "latex": r"E = mc^2", "label": "Energy"},
-        },
-        id="equation_reveal",
-    ),
-    pytest.param(
-        {
-            "beat_id": "def_2",
-            "narration": "One equation transforms into another.",
-            "visual": {
-                "type": "equation_transform",
-                "from_latex": r"A\vec{v} = \lambda\vec{v}",
-                "to_latex": r"\det(A - \lambda I) = 0",
-            },
-        },
-        id="equation_transform",
-    ),
-    pytest.param(
-        {
-            "beat_id": "def_3",
-            "narration": "Lambda is highlighted.",
-            "visual": {"type": "highlight", "target": r"\lambda", "color": "YELLOW"},
-        },
-        id="highlight",
-    ),
-    pytest.param(
-        {
-            "beat_id": "ex_1",
-            "narration": "Step one of the derivation.",
-            "visual": {"type": "step_reveal", "latex": r"2x = 6", "step_number": 1},
-        },
-        id="step_reveal",
-    ),
-    pytest.param(
-        {
-            "beat_id": "graph_1",
-            "narration": "Here is the parabola.",
-            "visual": {
-                "type": "graph_plot",
-                "functions": [{"expr": "x**2", "label": "f(x)", "color": "BLUE"}],
-                "x_range": [-3, 3],
-                "y_range": [-1, 9],
-            },
-        },
-        id="graph_plot",
-    ),
-    pytest.param(
-        {
-            "beat_id": "graph_2",
-            "narration": "Watch the sine wave change.",
-            "visual": {
-                "type": "graph_animate",
-                "function_expr": "np.sin(x * t)",
-                "parameter": "t",
-                "range": [1, 4],
-            },
-        },
-        id="graph_animate",
-    ),
-    pytest.param(
-        {
-            "beat_id": "vec_1",
-            "narration": "Here are two vectors.",
-            "visual": {
-                "type": "vector_show",
-                "vectors": [{"coords": [1, 0], "label": "e_1", "color": "BLUE"}],
-            },
-        },
-        id="vector_show",
-    ),
-    pytest.param(
-        {
-            "beat_id": "vec_2",
-            "narration": "The transformation stretches the vectors.",
-            "visual": {
-                "type": "vector_transform",
-                "matrix": [[2, 0], [0, 1]],
-                "vectors": [[1, 0], [0, 1]],
-            },
-        },
-        id="vector_transform",
-    ),
-    pytest.param(
-        {
-            "beat_id": "mat_1",
-            "narration": "Here is matrix A.",
-            "visual": {
-                "type": "matrix_display",
-                "matrix_values": [[1, 2], [3, 4]],
-                "highlight_elements": [[0, 0]],
-            },
-        },
-        id="matrix_display",
-    ),
-    pytest.param(
-        {
-            "beat_id": "thm_1",
-            "narration": "The Pythagorean theorem.",
-            "visual": {
-                "type": "theorem_card",
-                "theorem_name": "Pythagoras",
-                "statement_latex": r"a^2 + b^2 = c^2",
-            },
-        },
-        id="theorem_card",
-    ),
-    pytest.param(
-        {
-            "beat_id": "sum_1",
-            "narration": "In summary.",
-            "visual": {
-                "type": "summary_card",
-                "key_points": ["Eigenvalues scale eigenvectors.", r"Use \det(A - \lambda I) = 0."],
-            },
-        },
-        id="summary_card",
-    ),
-    pytest.param(
-        {
-            "beat_id": "txt_1",
-            "narration": "A plain text beat.",
-            "visual": {"type": "text_card", "text": "Hello world"},
-        },
-        id="text_card",
-    ),
+# (beat_id, narration, visual type, remaining visual fields)
+_BEAT_ROWS = (
+    ("intro_1", "Welcome to the lesson.", "title_card",
+     {"title": "Introduction", "subtitle": "Getting started"}),
+    ("def_1", "The famous energy equation.", "equation_reveal",
+     {"latex": r"E = mc^2", "label": "Energy"}),
+    ("def_2", "One equation transforms into another.", "equation_transform",
+     {"from_latex": r"A\vec{v} = \lambda\vec{v}", "to_latex": r"\det(A - \lambda I) = 0"}),
+    ("def_3", "Lambda is highlighted.", "highlight",
+     {"target": r"\lambda", "color": "YELLOW"}),
+    ("ex_1", "Step one of the derivation.", "step_reveal",
+     {"latex": r"2x = 6", "step_number": 1}),
+    ("graph_1", "Here is the parabola.", "graph_plot",
+     {"functions": [{"expr": "x**2", "label": "f(x)", "color": "BLUE"}],
+      "x_range": [-3, 3], "y_range": [-1, 9]}),
+    ("graph_2", "Watch the sine wave change.", "graph_animate",
+     {"function_expr": "np.sin(x * t)", "parameter": "t", "range": [1, 4]}),
+    ("vec_1", "Here are two vectors.", "vector_show",
+     {"vectors": [{"coords": [1, 0], "label": "e_1", "color": "BLUE"}]}),
+    ("vec_2", "The transformation stretches the vectors.", "vector_transform",
+     {"matrix": [[2, 0], [0, 1]], "vectors": [[1, 0], [0, 1]]}),
+    ("mat_1", "Here is matrix A.", "matrix_display",
+     {"matrix_values": [[1, 2], [3, 4]], "highlight_elements": [[0, 0]]}),
+    ("thm_1", "The Pythagorean theorem.", "theorem_card",
+     {"theorem_name": "Pythagoras", "statement_latex": r"a^2 + b^2 = c^2"}),
+    ("sum_1", "In summary.", "summary_card",
+     {"key_points": ["Eigenvalues scale eigenvectors.", r"Use \det(A - \lambda I) = 0."]}),
+    ("txt_1", "A plain text beat.", "text_card",
+     {"text": "Hello world"}),
+    ("pause_1", "A brief pause.", "pause",
+     {}),
+)
+
+ALL_BEAT_TYPES = tuple(
     pytest.param(
-        {
-            "beat_id": "pause_1",
-            "narration": "A brief pause.",
-            "visual": {"type": "pause"},
-        },
-        id="pause",
-    ),
-]
+        {"beat_id": bid, "narration": narration, "visual": {"type": vtype, **fields}},
+        id=vtype,
+    )
+    for bid, narration, vtype, fields in _BEAT_ROWS
+)
 
 
-# ── _to_class_name ────────────────────────────────────────────────────────────
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+_BEAT_RE = re.compile(rb"^_BEAT\s*=\s*json\.loads\((?P<payload>.+)\)\s*$", re.MULTILINE)
 
-class TestToClassName:
 
-    def test_simple_id(self):
-        assert _to_class_name("intro") == "MathVizScene_intro"
+def _extract_beat_literal(source: bytes) -> str:
+    """Return the JSON string passed to json.loads() in the `_BEAT = ...` line."""
+    m = _BEAT_RE.search(source)
+    assert m, "no `_BEAT = json.loads(...)` assignment in generated file"
+    return ast.literal_eval(m.group("payload").decode("utf-8"))
 
-    def test_hyphens_replaced_with_underscores(self):
-        assert _to_class_name("step-by-step") == "MathVizScene_step_by_step"
 
-    def test_dots_replaced_with_underscores(self):
-        assert _to_class_name("ch1.2") == "MathVizScene_ch1_2"
+# ── _to_class_name ────────────────────────────────────────────────────────────
 
-    def test_leading_digit_gets_prefix(self):
-        result = _to_class_name("1beat")
-        class_part = result[len("MathVizScene_"):]
-        assert class_part[0].isalpha() or class_part[0] == "_"
+class TestToClassName:
 
-    def test_spaces_replaced(self):
-        result = _to_class_name("my beat")
-        assert " " not in result
-        assert result.startswith("MathVizScene_")
+    @pytest.mark.parametrize("beat_id,check", [
+        pytest.param("intro",        lambda r: r == "MathVizScene_intro",        id="simple_id"),
+        pytest.param("step-by-step", lambda r: r == "MathVizScene_step_by_step", id="hyphens_replaced"),
+        pytest.param("ch1.2",        lambda r: r == "MathVizScene_ch1_2",        id="dots_replaced"),
+        pytest.param("1beat",
+                     lambda r: r[len("MathVizScene_")].isalpha() or r[len("MathVizScene_")] == "_",
+                     id="leading_digit_gets_prefix"),
+        pytest.param("my beat",
+                     lambda r: " " not in r and r.startswith("MathVizScene_"),
+                     id="spaces_replaced"),
+        pytest.param("ch1_1",        lambda r: r == "MathVizScene_ch1_1",        id="underscores_preserved"),
+        pytest.param("myBeat",       lambda r: r == "MathVizScene_myBeat",       id="mixed_case_preserved"),
+        *[
+            pytest.param(bid, str.isidentifier, id=f"valid_identifier:{bid}")
+            for bid in ["intro", "ch1-2", "1start", "a.b.c", "my beat"]
+        ],
+    ])
+    def test_to_class_name(self, beat_id, check):
+        result = _to_class_name(beat_id)
+        assert check(result), f"{beat_id!r} -> {result!r}"
+
+    def test_repeated_beat_id_served_from_cache(self):
+        first = _to_class_name("cache_probe_1")
+        hits_before = _to_class_name.cache_info().hits
+        assert _to_class_name("cache_probe_1") is first
+        assert _to_class_name.cache_info().hits == hits_before + 1
 
-    def test_underscores_preserved(self):
-        assert _to_class_name("ch1_1") == "MathVizScene_ch1_1"
 
-    def test_mixed_case_preserved(self):
-        assert _to_class_name("myBeat") == "MathVizScene_myBeat"
+# ── build_scene_file ──────────────────────────────────────────────────────────
 
-    def test_result_is_valid_python_identifier(self):
-        for beat_id in ["intro", "ch1-2", "1start", "a.b.c", "my beat"]:
-            result = _to_class_name(beat_id)
-            assert result.isidentifier(), f"{result!r} is not a valid identifier"
+SceneArtifact = namedtuple("SceneArtifact", "file_path class_name content")
 
 
-# ── build_scene_file ──────────────────────────────────────────────────────────
+@pytest.fixture(scope="session")
+def default_scene_artifact(tmp_path_factory, sample_beat, sample_style) -> SceneArtifact:
+    """
+    build_scene_file(sample_beat, sample_style, 5.0, None) — built and read
+    once per session for the tests that don't vary any input.
+    """
+    out = tmp_path_factory.mktemp("default_scene") / "scene_intro.py"
+    file_path, class_name = build_scene_file(
+        beat_config=sample_beat,
+        style=sample_style,
+        total_duration=5.0,
+        audio_path=None,
+        output_file=out,
+    )
+    return SceneArtifact(file_path, class_name, file_path.read_text(encoding="utf-8"))
+
 
 class TestBuildSceneFile:
 
-    def test_creates_output_file(self, tmp_path, sample_beat, sample_style):
-        out = tmp_path / "scene_intro.py"
-        file_path, _ = build_scene_file(
-            beat_config=sample_beat,
-            style=sample_style,
-            total_duration=5.0,
-            audio_path=None,
-            output_file=out,
-        )
+    def test_creates_output_file(self, default_scene_artifact):
+        file_path = default_scene_artifact.file_path
         assert file_path.exists()
-        assert file_path == out
+        assert file_path.name == "scene_intro.py"
 
-    def test_returns_correct_class_name(self, tmp_path, sample_beat, sample_style):
-        out = tmp_path / "scene.py"
-        _, class_name = build_scene_file(
-            beat_config=sample_beat,
-            style=sample_style,
-            total_duration=5.0,
-            audio_path=None,
-            output_file=out,
-        )
-        assert class_name == "MathVizScene_intro_1"
+    def test_returns_correct_class_name(self, default_scene_artifact):
+        assert default_scene_artifact.class_name == "MathVizScene_intro_1"
 
-    def test_generated_file_is_valid_python(self, tmp_path, sample_beat, sample_style):
-        out = tmp_path / "scene.py"
-        file_path, _ = build_scene_file(
-            beat_config=sample_beat,
-            style=sample_style,
-            total_duration=5.0,
-            audio_path=None,
-            output_file=out,
-        )
-        py_compile.compile(str(file_path), doraise=True)
+    @skip_compile
+    def test_generated_file_is_valid_python(self, default_scene_artifact):
+        compile(default_scene_artifact.content, str(default_scene_artifact.file_path), "exec")
 
-    def test_duration_injected_in_file(self, tmp_path, sample_beat, sample_style):
-        out = tmp_path / "scene.py"
+    def test_duration_injected_in_file(self, sample_beat, sample_style):
+        buf = io.StringIO()
         build_scene_file(
             beat_config=sample_beat,
             style=sample_style,
             total_duration=12.345,
             audio_path=None,
-            output_file=out,
+            output_file=buf,
         )
-        content = out.read_text(encoding="utf-8")
-        assert "12.345" in content
+        assert "12.345" in buf.getvalue()
 
     def test_audio_path_injected_in_file(self, tmp_path, sample_beat, sample_style):
-        out = tmp_path / "scene.py"
+        buf = io.StringIO()
         audio = tmp_path / "intro_1.wav"
         build_scene_file(
             beat_config=sample_beat,
             style=sample_style,
             total_duration=5.0,
             audio_path=audio,
-            output_file=out,
+            output_file=buf,
         )
-        content = out.read_text(encoding="utf-8")
-        assert "intro_1.wav" in content
+        assert "intro_1.wav" in buf.getvalue()
 
-    def test_audio_path_none_sets_none(self, tmp_path, sample_beat, sample_style):
-        out = tmp_path / "scene.py"
-        build_scene_file(
-            beat_config=sample_beat,
-            style=sample_style,
-            total_duration=5.0,
-            audio_path=None,
-            output_file=out,
-        )
-        content = out.read_text(encoding="utf-8")
-        assert "_AUDIO_FILE = None" in content
+    def test_audio_path_none_sets_none(self, default_scene_artifact):
+        assert "_AUDIO_FILE = None" in default_scene_artifact.content
+
+    def test_project_root_injected_in_file(self, default_scene_artifact):
+        assert f"_PROJECT_ROOT = {str(PROJECT_ROOT)!r}" in default_scene_artifact.content
 
+    @skip_compile
     def test_latex_backslashes_embedded_safely(self, tmp_path, sample_style):
         beat = {
             "beat_id": "eq_1",
@@ -291,8 +204,9 @@ class TestBuildSceneFile:
             audio_path=None,
             output_file=out,
         )
-        py_compile.compile(str(file_path), doraise=True)
+        compile(file_path.read_text(encoding="utf-8"), str(file_path), "exec")
 
+    @skip_compile
     def test_double_quotes_in_narration_safe(self, tmp_path, sample_style):
         beat = {
             "beat_id": "q_1",
@@ -307,8 +221,9 @@ class TestBuildSceneFile:
             audio_path=None,
             output_file=out,
         )
-        py_compile.compile(str(file_path), doraise=True)
+        compile(file_path.read_text(encoding="utf-8"), str(file_path), "exec")
 
+    @skip_compile
     def test_unicode_narration_safe(self, tmp_path, sample_style):
         beat = {
             "beat_id": "hindi_1",
@@ -323,7 +238,7 @@ class TestBuildSceneFile:
             audio_path=None,
             output_file=out,
         )
-        py_compile.compile(str(file_path), doraise=True)
+        compile(file_path.read_text(encoding="utf-8"), str(file_path), "exec")
 
     def test_creates_nested_parent_dirs(self, tmp_path, sample_beat, sample_style):
         out = tmp_path / "nested" / "deep" / "scene.py"
@@ -336,17 +251,29 @@ class TestBuildSceneFile:
         )
         assert out.exists()
 
-    def test_duration_rounded_to_three_decimals(self, tmp_path, sample_beat, sample_style):
-        out = tmp_path / "scene.py"
+    def test_duration_rounded_to_three_decimals(self, sample_beat, sample_style):
+        buf = io.StringIO()
         build_scene_file(
             beat_config=sample_beat,
             style=sample_style,
             total_duration=10.123456789,
             audio_path=None,
-            output_file=out,
+            output_file=buf,
         )
-        content = out.read_text(encoding="utf-8")
-        assert "10.123" in content
+        assert "10.123" in buf.getvalue()
+
+    def test_buffer_output_returns_buffer(self, sample_beat, sample_style):
+        buf = io.StringIO()
+        out, class_name = build_scene_file(
+            beat_config=sample_beat,
+            style=sample_style,
+            total_duration=5.0,
+            audio_path=None,
+            output_file=buf,
+        )
+        assert out is buf
+        assert class_name == "MathVizScene_intro_1"
+        compile(buf.getvalue(), "<scene>", "exec")
 
     @pytest.mark.parametrize("beat", ALL_BEAT_TYPES)
     def test_all_beat_types_produce_valid_python(self, tmp_path, sample_style, beat):
@@ -360,10 +287,10 @@ class TestBuildSceneFile:
             output_file=out,
         )
         assert file_path.exists()
-        py_compile.compile(str(file_path), doraise=True)
+        compile(file_path.read_text(encoding="utf-8"), str(file_path), "exec")
         assert class_name.startswith("MathVizScene_")
 
-    def test_beat_json_roundtrips_in_file(self, tmp_path, sample_style):
+    def test_beat_json_roundtrips_in_file(self, tmp_path, sample_style, json_loads):
         """The embedded JSON must decode back to the original beat dict."""
         beat = {
             "beat_id": "mat_1",
@@ -378,54 +305,55 @@ class TestBuildSceneFile:
             audio_path=None,
             output_file=out,
         )
-        content = out.read_text(encoding="utf-8")
-        for line in content.splitlines():
-            if line.startswith("_BEAT = json.loads("):
-                repr_str = line[len("_BEAT = json.loads("):-1]
-                decoded_json = eval(repr_str)
-                recovered = json.loads(decoded_json)
-                assert recovered["beat_id"] == beat["beat_id"]
-                assert recovered["visual"]["matrix_values"] == [[1, 2], [3, 4]]
-                break
+        recovered = json_loads(_extract_beat_literal(file_path.read_bytes()))
+        assert recovered["beat_id"] == beat["beat_id"]
+        assert recovered["visual"]["matrix_values"] == [[1, 2], [3, 4]]
 
 
 # ── build_all_scene_files ─────────────────────────────────────────────────────
 
-class TestBuildAllSceneFiles:
+def _text_beat(bid: str) -> dict:
+    return {
+        "beat_id": bid,
+        "narration": f"Narration for {bid}.",
+        "visual": {"type": "text_card", "text": bid},
+    }
 
-    def _beat(self, bid: str) -> dict:
-        return {
-            "beat_id": bid,
-            "narration": f"Narration for {bid}.",
-            "visual": {"type": "text_card", "text": bid},
-        }
 
-    def test_returns_ordered_list(self, tmp_path, sample_style):
-        beats = [self._beat("ch1_1"), self._beat("ch1_2"), self._beat("ch1_3")]
-        results = build_all_scene_files(
-            beats=beats,
-            style=sample_style,
-            durations={"ch1_1": 5.0, "ch1_2": 8.0, "ch1_3": 6.0},
-            audio_paths={},
-            scene_dir=tmp_path,
-        )
-        assert len(results) == 3
-        assert [r[0] for r in results] == ["ch1_1", "ch1_2", "ch1_3"]
+@pytest.fixture(scope="module")
+def _batch_b1_b2(tmp_path_factory, sample_style) -> list[tuple[str, Path, str]]:
+    return build_all_scene_files(
+        beats=[_text_beat("b1"), _text_beat("b2")],
+        style=sample_style,
+        durations={"b1": 5.0, "b2": 7.0},
+        audio_paths={},
+        scene_dir=tmp_path_factory.mktemp("scenes_b1b2"),
+    )
 
-    def test_all_files_created_on_disk(self, tmp_path, sample_style):
-        beats = [self._beat("b1"), self._beat("b2")]
-        results = build_all_scene_files(
-            beats=beats,
-            style=sample_style,
-            durations={"b1": 5.0, "b2": 7.0},
-            audio_paths={},
-            scene_dir=tmp_path,
-        )
-        for _, file_path, _ in results:
+
+@pytest.fixture(scope="module")
+def _batch_ordered_ch1(tmp_path_factory, sample_style) -> list[tuple[str, Path, str]]:
+    return build_all_scene_files(
+        beats=[_text_beat("ch1_1"), _text_beat("ch1_2"), _text_beat("ch1_3")],
+        style=sample_style,
+        durations={"ch1_1": 5.0, "ch1_2": 8.0, "ch1_3": 6.0},
+        audio_paths={},
+        scene_dir=tmp_path_factory.mktemp("scenes_ch1"),
+    )
+
+
+class TestBuildAllSceneFiles:
+
+    def test_returns_ordered_list(self, _batch_ordered_ch1):
+        assert len(_batch_ordered_ch1) == 3
+        assert [r[0] for r in _batch_ordered_ch1] == ["ch1_1", "ch1_2", "ch1_3"]
+
+    def test_all_files_created_on_disk(self, _batch_b1_b2):
+        for _, file_path, _ in _batch_b1_b2:
             assert file_path.exists()
 
     def test_missing_duration_defaults_to_ten(self, tmp_path, sample_style):
-        beats = [self._beat("b1")]
+        beats = [_text_beat("b1")]
         results = build_all_scene_files(
             beats=beats,
             style=sample_style,
@@ -434,11 +362,10 @@ class TestBuildAllSceneFiles:
             scene_dir=tmp_path,
         )
         _, file_path, _ = results[0]
-        content = file_path.read_text(encoding="utf-8")
-        assert "10.0" in content
+        assert b"10.0" in file_path.read_bytes()
 
     def test_audio_path_injected_per_beat(self, tmp_path, sample_style):
-        beats = [self._beat("b1")]
+        beats = [_text_beat("b1")]
         audio = tmp_path / "b1.wav"
         results = build_all_scene_files(
             beats=beats,
@@ -448,22 +375,13 @@ class TestBuildAllSceneFiles:
             scene_dir=tmp_path,
         )
         _, file_path, _ = results[0]
-        content = file_path.read_text(encoding="utf-8")
-        assert "b1.wav" in content
+        assert b"b1.wav" in file_path.read_bytes()
 
-    def test_returns_tuple_of_id_path_classname(self, tmp_path, sample_style):
-        beats = [self._beat("intro_1")]
-        results = build_all_scene_files(
-            beats=beats,
-            style=sample_style,
-            durations={},
-            audio_paths={},
-            scene_dir=tmp_path,
-        )
-        bid, file_path, class_name = results[0]
-        assert bid == "intro_1"
+    def test_returns_tuple_of_id_path_classname(self, _batch_ordered_ch1):
+        bid, file_path, class_name = _batch_ordered_ch1[0]
+        assert bid == "ch1_1"
         assert isinstance(file_path, Path)
-        assert class_name == "MathVizScene_intro_1"
+        assert class_name == "MathVizScene_ch1_1"
 
     def test_empty_beats_returns_empty_list(self, tmp_path, sample_style):
         results = build_all_scene_files(
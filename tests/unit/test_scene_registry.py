@@ -15,231 +15,157 @@ No actual Manim rendering occurs — all scene internals are mocked.
 
 from __future__ import annotations
 
-import re
+import importlib
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from scenes import build_beat_scene
-from scenes.base import BaseEngineeringScene
-from scenes.equation_reveal import EquationRevealScene
-from scenes.equation_transform import EquationTransformScene
-from scenes.graph_animate import GraphAnimateScene
-from scenes.graph_plot import GraphPlotScene
-from scenes.highlight import HighlightScene
-from scenes.matrix_display import MatrixDisplayScene
-from scenes.pause import PauseScene
-from scenes.step_reveal import StepRevealScene
-from scenes.summary_card import SummaryCardScene
-from scenes.text_card import TextCardScene
-from scenes.theorem_card import TheoremCardScene
-from scenes.title_card import TitleCardScene
-from scenes.vector_show import VectorShowScene
-from scenes.vector_transform import VectorTransformScene
 
-SAMPLE_STYLE = {"theme": "dark", "accent_color": "#58C4DD"}
 
+def _cls(name: str) -> type:
+    """Lazily resolve a scene class by module name: "equation_reveal" → EquationRevealScene."""
+    module = importlib.import_module(f"scenes.{name}")
+    return getattr(module, f"{name.title().replace('_', '')}Scene")
 
-def _beat(beat_id: str, visual: dict, narration: str = "Test narration.") -> dict:
-    return {"beat_id": beat_id, "narration": narration, "visual": visual}
 
+SAMPLE_STYLE = MappingProxyType({"theme": "dark", "accent_color": "#58C4DD"})
 
-# ── Fallback for unknown/invalid types ───────────────────────────────────────
 
-class TestUnknownTypeFallback:
+# build_beat_scene only reads the beat, so every helper beat starts from one
+# shared template instead of rebuilding the same keys each call.
+_BEAT_TEMPLATE = {"beat_id": "", "narration": "Test narration.", "visual": {}}
 
-    def test_unknown_type_returns_text_card_subclass(self):
-        beat = _beat("u1", {"type": "animation", "data": "x"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TextCardScene)
 
-    def test_null_type_returns_text_card_subclass(self):
-        beat = _beat("u5", {"type": None})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TextCardScene)
+def _beat(beat_id: str, visual: dict, narration: str | None = None) -> dict:
+    beat = _BEAT_TEMPLATE.copy()
+    beat["beat_id"] = beat_id
+    beat["visual"] = visual
+    if narration is not None:
+        beat["narration"] = narration
+    return beat
 
-    def test_empty_string_type_returns_text_card_subclass(self):
-        beat = _beat("u6", {"type": ""})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TextCardScene)
 
-    def test_missing_type_field_returns_text_card_subclass(self):
-        beat = _beat("u7", {"latex": "x^2"})  # no 'type' key
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TextCardScene)
+# ── Fallback for unknown/invalid types ───────────────────────────────────────
 
-    def test_misspelled_type_returns_text_card_subclass(self):
-        beat = _beat("ms", {"type": "equation_reval", "latex": "x^2"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TextCardScene)
+_FALLBACK_BEATS = (
+    pytest.param(_beat("u1", {"type": "animation", "data": "x"}), id="unknown_type"),
+    pytest.param(_beat("u5", {"type": None}), id="null_type"),
+    pytest.param(_beat("u6", {"type": ""}), id="empty_string_type"),
+    pytest.param(_beat("u7", {"latex": "x^2"}), id="missing_type_field"),
+    pytest.param(_beat("ms", {"type": "equation_reval", "latex": "x^2"}), id="misspelled_type"),
+    # If 'visual' key is absent, visual={} → type=text_card (default)
+    pytest.param({"beat_id": "nv", "narration": "No visual."}, id="missing_visual_entirely"),
+)
 
-    def test_missing_visual_entirely_returns_text_card_subclass(self):
-        """If 'visual' key is absent, visual={} → type=text_card (default)."""
-        beat = {"beat_id": "nv", "narration": "No visual."}
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TextCardScene)
+
+class TestUnknownTypeFallback:
+
+    @pytest.mark.parametrize("beat", _FALLBACK_BEATS)
+    def test_returns_text_card_subclass(self, beat, scene_builder):
+        cls = scene_builder(beat, SAMPLE_STYLE)
+        assert cls.__mro__[1] is _cls("text_card")
 
 
 # ── Correct base class for all 14 known types ─────────────────────────────────
 
+# (visual type, remaining visual fields) — the expected base is _cls(type).
+_KNOWN_TYPE_CASES = (
+    ("title_card",         {"title": "Test"}),
+    ("equation_reveal",    {"latex": "x^2"}),
+    ("equation_transform", {"from_latex": "x^2", "to_latex": "2x"}),
+    ("highlight",          {"target": r"\lambda", "color": "YELLOW"}),
+    ("step_reveal",        {"latex": "x^2", "step_number": 1}),
+    ("graph_plot",         {"functions": [{"expr": "x**2"}], "x_range": [-3, 3], "y_range": [-9, 9]}),
+    ("graph_animate",      {"function_expr": "a*x**2", "parameter": "a", "range": [0.5, 2.0]}),
+    ("vector_show",        {"vectors": [{"coords": [1, 0]}]}),
+    ("vector_transform",   {"matrix": [[2, 0], [0, 1]], "vectors": [{"coords": [1, 0]}]}),
+    ("matrix_display",     {"matrix_values": [[1, 2], [3, 4]]}),
+    ("summary_card",       {"key_points": ["Point 1.", "Point 2."]}),
+    ("theorem_card",       {"theorem_name": "Pythagoras", "statement_latex": r"a^2 + b^2 = c^2"}),
+    ("text_card",          {"text": "Hello."}),
+    ("pause",              {}),
+)
+
+# Minimal visual for every known type, used for the base-class check.
+_ALL_VISUALS = (
+    {"type": "title_card", "title": "T"},
+    {"type": "equation_reveal", "latex": "x"},
+    {"type": "equation_transform", "from_latex": "x", "to_latex": "y"},
+    {"type": "highlight", "target": "x", "color": "YELLOW"},
+    {"type": "step_reveal", "latex": "x", "step_number": 1},
+    {"type": "graph_plot", "functions": [{"expr": "x"}], "x_range": [-1, 1], "y_range": [-1, 1]},
+    {"type": "graph_animate", "function_expr": "x", "parameter": "a", "range": [0, 1]},
+    {"type": "vector_show", "vectors": [{"coords": [1, 0]}]},
+    {"type": "vector_transform", "matrix": [[1, 0], [0, 1]], "vectors": [{"coords": [1, 0]}]},
+    {"type": "matrix_display", "matrix_values": [[1, 2], [3, 4]]},
+    {"type": "summary_card", "key_points": ["P1."]},
+    {"type": "theorem_card", "theorem_name": "T", "statement_latex": "x"},
+    {"type": "text_card", "text": "Hi"},
+    {"type": "pause"},
+)
+
+
 class TestKnownTypeMapping:
 
-    def test_title_card_returns_title_card_scene_subclass(self):
-        beat = _beat("tc", {"type": "title_card", "title": "Test"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TitleCardScene)
-
-    def test_equation_reveal_returns_equation_reveal_scene_subclass(self):
-        beat = _beat("er", {"type": "equation_reveal", "latex": "x^2"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, EquationRevealScene)
-
-    def test_equation_transform_returns_equation_transform_scene_subclass(self):
-        beat = _beat("et", {"type": "equation_transform", "from_latex": "x^2", "to_latex": "2x"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, EquationTransformScene)
-
-    def test_highlight_returns_highlight_scene_subclass(self):
-        beat = _beat("hl", {"type": "highlight", "target": r"\lambda", "color": "YELLOW"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, HighlightScene)
-
-    def test_step_reveal_returns_step_reveal_scene_subclass(self):
-        beat = _beat("sr", {"type": "step_reveal", "latex": "x^2", "step_number": 1})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, StepRevealScene)
-
-    def test_graph_plot_returns_graph_plot_scene_subclass(self):
-        beat = _beat("gp", {
-            "type": "graph_plot",
-            "functions": [{"expr": "x**2"}],
-            "x_range": [-3, 3],
-            "y_range": [-9, 9],
-        })
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, GraphPlotScene)
-
-    def test_graph_animate_returns_graph_animate_scene_subclass(self):
-        beat = _beat("ga", {
-            "type": "graph_animate",
-            "function_expr": "a*x**2",
-            "parameter": "a",
-            "range": [0.5, 2.0],
-        })
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, GraphAnimateScene)
-
-    def test_vector_show_returns_vector_show_scene_subclass(self):
-        beat = _beat("vs", {"type": "vector_show", "vectors": [{"coords": [1, 0]}]})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, VectorShowScene)
-
-    def test_vector_transform_returns_vector_transform_scene_subclass(self):
-        beat = _beat("vt", {
-            "type": "vector_transform",
-            "matrix": [[2, 0], [0, 1]],
-            "vectors": [{"coords": [1, 0]}],
-        })
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, VectorTransformScene)
-
-    def test_matrix_display_returns_matrix_display_scene_subclass(self):
-        beat = _beat("md", {"type": "matrix_display", "matrix_values": [[1, 2], [3, 4]]})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, MatrixDisplayScene)
-
-    def test_summary_card_returns_summary_card_scene_subclass(self):
-        beat = _beat("sc", {"type": "summary_card", "key_points": ["Point 1.", "Point 2."]})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, SummaryCardScene)
-
-    def test_theorem_card_returns_theorem_card_scene_subclass(self):
-        beat = _beat("thm", {
-            "type": "theorem_card",
-            "theorem_name": "Pythagoras",
-            "statement_latex": r"a^2 + b^2 = c^2",
-        })
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TheoremCardScene)
-
-    def test_text_card_returns_text_card_scene_subclass(self):
-        beat = _beat("txt", {"type": "text_card", "text": "Hello."})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, TextCardScene)
-
-    def test_pause_returns_pause_scene_subclass(self):
-        beat = _beat("ps", {"type": "pause"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        assert issubclass(cls, PauseScene)
-
-    def test_all_scene_classes_inherit_from_base(self):
+    @pytest.mark.parametrize("vtype,extra", _KNOWN_TYPE_CASES, ids=[c[0] for c in _KNOWN_TYPE_CASES])
+    def test_known_type_maps_to_scene_subclass(self, vtype, extra, scene_builder):
+        cls = scene_builder(_beat(vtype, {"type": vtype, **extra}), SAMPLE_STYLE)
+        assert cls.__mro__[1] is _cls(vtype)
+
+    @pytest.mark.parametrize("visual", _ALL_VISUALS, ids=lambda v: v["type"])
+    def test_all_scene_classes_inherit_from_base(self, visual, scene_builder):
         """All returned classes ultimately inherit from BaseEngineeringScene."""
-        visuals = [
-            {"type": "title_card", "title": "T"},
-            {"type": "equation_reveal", "latex": "x"},
-            {"type": "equation_transform", "from_latex": "x", "to_latex": "y"},
-            {"type": "highlight", "target": "x", "color": "YELLOW"},
-            {"type": "step_reveal", "latex": "x", "step_number": 1},
-            {"type": "graph_plot", "functions": [{"expr": "x"}], "x_range": [-1, 1], "y_range": [-1, 1]},
-            {"type": "graph_animate", "function_expr": "x", "parameter": "a", "range": [0, 1]},
-            {"type": "vector_show", "vectors": [{"coords": [1, 0]}]},
-            {"type": "vector_transform", "matrix": [[1, 0], [0, 1]], "vectors": [{"coords": [1, 0]}]},
-            {"type": "matrix_display", "matrix_values": [[1, 2], [3, 4]]},
-            {"type": "summary_card", "key_points": ["P1."]},
-            {"type": "theorem_card", "theorem_name": "T", "statement_latex": "x"},
-            {"type": "text_card", "text": "Hi"},
-            {"type": "pause"},
-        ]
-        for i, visual in enumerate(visuals):
-            beat = _beat(f"b{i}", visual)
-            cls = build_beat_scene(beat, SAMPLE_STYLE)
-            assert issubclass(cls, BaseEngineeringScene), f"Failed for {visual['type']}"
+        from scenes.base import BaseEngineeringScene
+
+        cls = scene_builder(_beat(visual["type"], visual), SAMPLE_STYLE)
+        assert issubclass(cls, BaseEngineeringScene)
 
 
 # ── Class name sanitization ───────────────────────────────────────────────────
 
 class TestClassNameSanitization:
 
-    def test_class_name_starts_with_beat_scene(self):
+    def test_class_name_starts_with_beat_scene(self, scene_builder):
         beat = _beat("intro_1", {"type": "pause"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.__name__.startswith("_BeatScene_")
 
-    def test_class_name_has_sanitized_beat_id(self):
+    def test_class_name_has_sanitized_beat_id(self, scene_builder):
         beat = _beat("intro_1", {"type": "pause"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert "intro_1" in cls.__name__
 
-    def test_hyphens_in_beat_id_sanitized(self):
+    def test_hyphens_in_beat_id_sanitized(self, scene_builder):
         beat = _beat("ch1-beat-2", {"type": "pause"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         # Class name must be a valid Python identifier
         assert cls.__name__.isidentifier()
         # Hyphens replaced with underscores
         assert "-" not in cls.__name__
 
-    def test_dots_in_beat_id_sanitized(self):
+    def test_dots_in_beat_id_sanitized(self, scene_builder):
         beat = _beat("ch1.2.3", {"type": "pause"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.__name__.isidentifier()
         assert "." not in cls.__name__
 
-    def test_spaces_in_beat_id_sanitized(self):
+    def test_spaces_in_beat_id_sanitized(self, scene_builder):
         beat = _beat("my beat", {"type": "pause"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.__name__.isidentifier()
         assert " " not in cls.__name__
 
-    def test_class_name_is_valid_python_identifier(self):
-        for beat_id in ["intro", "ch1-2", "a.b.c", "step 1", "x@y"]:
-            beat = _beat(beat_id, {"type": "pause"})
-            cls = build_beat_scene(beat, SAMPLE_STYLE)
-            assert cls.__name__.isidentifier(), f"Not an identifier: {cls.__name__!r}"
+    @pytest.mark.parametrize("beat_id", ["intro", "ch1-2", "a.b.c", "step 1", "x@y"])
+    def test_class_name_is_valid_python_identifier(self, beat_id, scene_builder):
+        cls = scene_builder(_beat(beat_id, {"type": "pause"}), SAMPLE_STYLE)
+        assert cls.__name__.isidentifier()
 
-    def test_unknown_beat_id_gets_class_name(self):
+    def test_unknown_beat_id_gets_class_name(self, scene_builder):
         """Beat with missing beat_id uses 'unknown' as the ID."""
         beat = {"narration": "No ID.", "visual": {"type": "pause"}}
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert "unknown" in cls.__name__
 
 
@@ -272,115 +198,134 @@ class TestStyleAttributes:
 
 class TestVisualParamsAsAttrs:
 
-    def test_latex_param_set_as_class_attr(self):
+    def test_latex_param_set_as_class_attr(self, scene_builder):
         beat = _beat("er", {"type": "equation_reveal", "latex": r"E = mc^2"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.latex == r"E = mc^2"
 
-    def test_title_param_set_as_class_attr(self):
+    def test_title_param_set_as_class_attr(self, scene_builder):
         beat = _beat("tc", {"type": "title_card", "title": "My Title"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.title == "My Title"
 
-    def test_subtitle_param_set_as_class_attr(self):
+    def test_subtitle_param_set_as_class_attr(self, scene_builder):
         beat = _beat("tc", {"type": "title_card", "title": "T", "subtitle": "S"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.subtitle == "S"
 
-    def test_key_points_param_set_as_class_attr(self):
+    def test_key_points_param_set_as_class_attr(self, scene_builder):
         pts = ["Point 1.", "Point 2."]
         beat = _beat("sc", {"type": "summary_card", "key_points": pts})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.key_points == pts
 
-    def test_type_field_not_set_as_class_attr(self):
+    def test_type_field_not_set_as_class_attr(self, scene_builder):
         """The 'type' key from visual is excluded from class attrs."""
         beat = _beat("tc", {"type": "title_card", "title": "T"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         # 'type' should not be a new attribute added by build_beat_scene
         # (it may exist on Scene, but not injected by the builder)
         assert "type" not in cls.__dict__
 
-    def test_matrix_values_param_set_as_class_attr(self):
+    def test_same_beat_id_different_params_not_shared(self, scene_builder):
+        """The memoised builder must key on the whole beat, not just id + type."""
+        a = scene_builder(_beat("tc", {"type": "title_card", "title": "A"}), SAMPLE_STYLE)
+        b = scene_builder(_beat("tc", {"type": "title_card", "title": "B"}), SAMPLE_STYLE)
+        assert a is not b
+        assert (a.title, b.title) == ("A", "B")
+
+    def test_matrix_values_param_set_as_class_attr(self, scene_builder):
         mv = [[1, 2], [3, 4]]
         beat = _beat("md", {"type": "matrix_display", "matrix_values": mv})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert cls.matrix_values == mv
 
 
 # ── _safe_construct ───────────────────────────────────────────────────────────
 
+_VALUE_ERROR = ValueError("bad latex")
+_RUNTIME_ERROR = RuntimeError("crash")
+
+
+def _raise_value_error(self):
+    raise _VALUE_ERROR
+
+
+def _raise_runtime_error(self):
+    raise _RUNTIME_ERROR
+
+
+@pytest.fixture(scope="module")
+def mock_scene_self():
+    """Minimal stand-in for a scene instance; attributes are created lazily."""
+    return MagicMock()
+
+
+# Only constants and a no-op callable are needed by the fallback path.
+_FAKE_MANIM = SimpleNamespace(ORIGIN=object(), WHITE=object(), FadeIn=lambda *a, **kw: None)
+
+
+@pytest.fixture(scope="class")
+def _fake_manim():
+    """
+    Stand-in for the `from manim import ORIGIN, WHITE, FadeIn` inside the
+    _safe_construct fallback, installed once per test class.
+    """
+    with patch.dict("sys.modules", {"manim": _FAKE_MANIM}):
+        yield _FAKE_MANIM
+
+
+@pytest.mark.usefixtures("_fake_manim")
 class TestSafeConstruct:
 
-    def test_safe_construct_is_defined_on_returned_class(self):
+    def test_safe_construct_is_defined_on_returned_class(self, scene_builder):
         """_safe_construct replaces construct() in the returned class."""
         beat = _beat("b1", {"type": "equation_reveal", "latex": "x^2"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         # construct should be in the class's own __dict__ (not just inherited)
         assert "construct" in cls.__dict__
 
-    def test_safe_construct_is_callable(self):
+    def test_safe_construct_is_callable(self, scene_builder):
         beat = _beat("b1", {"type": "pause"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         assert callable(cls.__dict__["construct"])
 
-    def test_safe_construct_catches_exception_from_base_construct(self):
+    def test_safe_construct_catches_exception_from_base_construct(self, scene_builder, mock_scene_self, monkeypatch):
         """
         When the parent's construct() raises, _safe_construct catches it and
         runs the fallback. The fallback itself is mocked to do nothing.
         The important property is: no exception escapes _safe_construct.
         """
         beat = _beat("err_beat", {"type": "equation_reveal", "latex": "x^2"}, narration="Fallback text.")
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-
-        # Create a mock scene instance with the minimum interface
-        mock_self = MagicMock()
+        cls = scene_builder(beat, SAMPLE_STYLE)
 
         # Patch the base construct to raise an exception
-        with patch.object(EquationRevealScene, "construct", side_effect=ValueError("bad latex")):
-            # Patch manim imports inside the closure to avoid import errors
-            with patch.dict("sys.modules", {
-                "manim": MagicMock(
-                    ORIGIN=MagicMock(),
-                    WHITE=MagicMock(),
-                    FadeIn=MagicMock(),
-                ),
-            }):
-                # Should NOT raise
-                try:
-                    cls.__dict__["construct"](mock_self)
-                except Exception as exc:
-                    pytest.fail(f"_safe_construct let an exception escape: {exc}")
-
-    def test_safe_construct_logs_error_on_exception(self):
+        monkeypatch.setattr(_cls("equation_reveal"), "construct", _raise_value_error)
+        # Should NOT raise
+        try:
+            cls.__dict__["construct"](mock_scene_self)
+        except Exception as exc:
+            pytest.fail(f"_safe_construct let an exception escape: {exc}")
+
+    def test_safe_construct_logs_error_on_exception(self, scene_builder, mock_scene_self, monkeypatch):
         """When base construct() raises, _safe_construct logs the error."""
-        import logging
-
         beat = _beat("log_beat", {"type": "equation_reveal", "latex": "x^2"})
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
-        mock_self = MagicMock()
-
-        with patch.object(EquationRevealScene, "construct", side_effect=RuntimeError("crash")):
-            with patch("logging.Logger.error") as mock_log:
-                with patch.dict("sys.modules", {
-                    "manim": MagicMock(
-                        ORIGIN=MagicMock(),
-                        WHITE=MagicMock(),
-                        FadeIn=MagicMock(),
-                    ),
-                }):
-                    try:
-                        cls.__dict__["construct"](mock_self)
-                    except Exception:
-                        pass
-                # Logger.error should have been called
-                assert mock_log.called
-
-    def test_safe_construct_narration_truncated_to_200_chars(self):
+        cls = scene_builder(beat, SAMPLE_STYLE)
+
+        monkeypatch.setattr(_cls("equation_reveal"), "construct", _raise_runtime_error)
+        with patch("logging.Logger.error") as mock_log:
+            try:
+                cls.__dict__["construct"](mock_scene_self)
+            except Exception:
+                pass
+            # Logger.error should have been called
+            assert mock_log.called
+
+    def test_safe_construct_narration_truncated_to_200_chars(self, scene_builder):
         """The narration fallback text is sliced to 200 chars max."""
         long_narration = "A" * 500
         beat = _beat("long", {"type": "text_card", "text": "Hi"}, narration=long_narration)
-        cls = build_beat_scene(beat, SAMPLE_STYLE)
+        cls = scene_builder(beat, SAMPLE_STYLE)
         # The _safe_construct closure captures narration[:200]; verify the closure was set up
         # We can't easily test this without running Manim, but we can verify the class exists
         assert "construct" in cls.__dict__
@@ -18,83 +18,66 @@ All subprocess and network calls are mocked.
 from __future__ import annotations
 
 import asyncio
+import io
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from subprocess import CompletedProcess
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from composer.ffmpeg_merge import VideoComposer
+from renderer.render_engine import render_all_parallel
+
 
 # ── render_all_parallel return signature ─────────────────────────────────────
 
-class TestRenderAllParallelReturnSignature:
+@pytest.fixture(scope="module")
+def _fake_mp4(tmp_path_factory):
+    mp4 = tmp_path_factory.mktemp("render") / "b1.mp4"
+    mp4.write_bytes(b"fake")
+    return mp4
+
 
-    async def test_returns_tuple_of_two_dicts(self, tmp_path):
-        """render_all_parallel always returns a 2-tuple: (rendered_map, errors)."""
-        from renderer.render_engine import render_all_parallel
+def _fake_render(mp4: Path, failing: frozenset, message: str | None):
+    """asyncio.to_thread stand-in: fail for segment ids in `failing`, else return mp4."""
+    async def render(fn, scene_file, class_name, media_dir, quality):
+        if class_name.removeprefix("MyScene_") in failing:
+            raise RuntimeError(message or f"Manim render failed for '{class_name}'")
+        return mp4
+    return render
 
-        tasks = [("b1", tmp_path / "scene.py", "MyScene", tmp_path / "media")]
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            fake_mp4 = tmp_path / "b1.mp4"
-            fake_mp4.write_bytes(b"fake")
-            mock_thread.return_value = fake_mp4
-            result = await render_all_parallel(tasks, quality="medium")
+class TestRenderAllParallelReturnSignature:
+
+    @pytest.mark.parametrize("seg_ids,failing,message,expected_rendered,expected_errors", [
+        pytest.param(("b1",), (), None, {"b1"}, set(), id="single_success"),
+        pytest.param(("b1",), ("b1",), None, set(), {"b1"}, id="single_failure"),
+        # 7.2: every beat fails → ({}, errors); the pipeline then raises
+        pytest.param(("b1", "b2"), ("b1", "b2"), None, set(), {"b1", "b2"}, id="all_fail"),
+        pytest.param(("b1", "b2"), ("b2",), None, {"b1"}, {"b2"}, id="partial_failure"),
+        # Message names no class → still filed under the task's segment id
+        pytest.param(("b1", "b2"), ("b1", "b2"), "Manim crash", set(), {"b1", "b2"},
+                     id="unattributed_failure"),
+    ])
+    async def test_render_outcome(
+        self, _fake_mp4, patch_to_thread, seg_ids, failing, message, expected_rendered, expected_errors,
+    ):
+        """render_all_parallel returns (rendered_map, errors) keyed by segment_id."""
+        root = _fake_mp4.parent
+        tasks = [(sid, root / f"{sid}.py", f"MyScene_{sid}", root / sid) for sid in seg_ids]
+
+        patch_to_thread.side_effect = _fake_render(_fake_mp4, frozenset(failing), message)
+        result = await render_all_parallel(tasks, quality="medium")
 
         assert isinstance(result, tuple)
         assert len(result) == 2
         rendered_map, errors = result
         assert isinstance(rendered_map, dict)
         assert isinstance(errors, dict)
-
-    async def test_successful_renders_in_rendered_map(self, tmp_path):
-        """Successful renders appear in the rendered_map dict keyed by segment_id."""
-        from renderer.render_engine import render_all_parallel
-
-        fake_mp4 = tmp_path / "b1.mp4"
-        fake_mp4.write_bytes(b"fake")
-
-        tasks = [("b1", tmp_path / "scene.py", "MyScene_b1", tmp_path / "media")]
-
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = fake_mp4
-            rendered_map, errors = await render_all_parallel(tasks)
-
-        assert "b1" in rendered_map
-        assert errors == {} or isinstance(errors, dict)
-
-    async def test_failed_renders_in_errors_dict(self, tmp_path):
-        """Failed renders appear in the errors dict."""
-        from renderer.render_engine import render_all_parallel
-
-        tasks = [("b1", tmp_path / "scene.py", "MyScene_b1", tmp_path / "media")]
-
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = RuntimeError("Manim render failed for 'MyScene_b1'")
-            rendered_map, errors = await render_all_parallel(tasks)
-
-        assert rendered_map == {}
-        assert len(errors) >= 1
-        # The error message should be stored somewhere in errors
-        assert any("b1" in k or "MyScene_b1" in v for k, v in errors.items())
-
-    async def test_7_2_all_beats_fail_returns_empty_rendered_map(self, tmp_path):
-        """
-        When all beats fail, render_all_parallel returns ({}, non-empty errors dict).
-        The pipeline then raises RuntimeError('All beats failed').
-        """
-        from renderer.render_engine import render_all_parallel
-
-        tasks = [
-            ("b1", tmp_path / "s1.py", "MyScene_b1", tmp_path / "m1"),
-            ("b2", tmp_path / "s2.py", "MyScene_b2", tmp_path / "m2"),
-        ]
-
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = RuntimeError("Manim crash")
-            rendered_map, errors = await render_all_parallel(tasks)
-
-        assert rendered_map == {}
-        assert len(errors) > 0
+        assert set(rendered_map) == expected_rendered
+        assert set(errors) == expected_errors
+        assert all(errors.values())
 
     async def test_7_2_pipeline_raises_runtime_error_when_all_fail(self, tmp_path):
         """
@@ -115,35 +98,17 @@ class TestRenderAllParallelReturnSignature:
             with pytest.raises(RuntimeError, match="beats failed to render"):
                 raise RuntimeError(error_msg)
 
-    async def test_partial_failure_only_failed_in_errors(self, tmp_path):
-        """When some beats fail and some succeed, only failures appear in errors."""
-        from renderer.render_engine import render_all_parallel
-
-        fake_mp4 = tmp_path / "b1.mp4"
-        fake_mp4.write_bytes(b"fake")
-
-        tasks = [
-            ("b1", tmp_path / "s1.py", "MyScene_b1", tmp_path / "m1"),
-            ("b2", tmp_path / "s2.py", "MyScene_b2", tmp_path / "m2"),
-        ]
-
-        call_count = {"n": 0}
-        async def side_effect(*args, **kwargs):
-            call_count["n"] += 1
-            if call_count["n"] == 1:
-                return fake_mp4
-            raise RuntimeError("Manim render failed for 'MyScene_b2'")
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = side_effect
-            rendered_map, errors = await render_all_parallel(tasks)
-
-        assert "b1" in rendered_map
-        assert "b2" not in rendered_map
+# ── VideoComposer single-segment concatenation ────────────────────────────────
 
+@pytest.fixture(scope="class")
+def _no_ffmpeg_check():
+    """Let VideoComposer be instantiated without an FFmpeg binary, once per class."""
+    with patch.object(VideoComposer, "_verify_ffmpeg", return_value=None):
+        yield
 
-# ── VideoComposer single-segment concatenation ────────────────────────────────
 
+@pytest.mark.usefixtures("_no_ffmpeg_check")
 class TestVideoComposerSingleSegment:
 
     def test_7_6_single_segment_concatenate_copies_file(self, tmp_path):
@@ -151,74 +116,180 @@ class TestVideoComposerSingleSegment:
         VideoComposer.concatenate with 1 segment copies the file using shutil.copy2.
         No FFmpeg subprocess is invoked for a single segment.
         """
-        from composer.ffmpeg_merge import VideoComposer
-
-        seg = tmp_path / "seg1.mp4"
-        seg.write_bytes(b"fake mp4 content")
+        seg = tmp_path / "seg1.mp4"   # never opened: shutil.copy2 is mocked
         out = tmp_path / "out.mp4"
 
-        # Mock _verify_ffmpeg so VideoComposer can be instantiated without FFmpeg
-        with patch.object(VideoComposer, "_verify_ffmpeg", return_value=None):
-            vc = VideoComposer()
-            with patch("shutil.copy2") as mock_copy:
-                vc.concatenate([str(seg)], str(out))
-                mock_copy.assert_called_once_with(str(seg), str(out))
+        vc = VideoComposer()
+        with patch("shutil.copy2") as mock_copy:
+            vc.concatenate([str(seg)], str(out))
+            mock_copy.assert_called_once_with(str(seg), str(out))
 
     def test_7_6_empty_segment_list_raises_value_error(self, tmp_path):
         """VideoComposer.concatenate([]) raises ValueError."""
-        from composer.ffmpeg_merge import VideoComposer
-
         out = tmp_path / "out.mp4"
-        with patch.object(VideoComposer, "_verify_ffmpeg", return_value=None):
-            vc = VideoComposer()
-            with pytest.raises(ValueError, match="No segments"):
-                vc.concatenate([], str(out))
+        vc = VideoComposer()
+        with pytest.raises(ValueError, match="No segments"):
+            vc.concatenate([], str(out))
 
 
 # ── FFmpeg failure propagation ────────────────────────────────────────────────
 
+@pytest.mark.usefixtures("_no_ffmpeg_check")
 class TestFfmpegFailure:
 
     def test_7_7_merge_segment_ffmpeg_failure_raises_runtime_error(self, tmp_path):
         """
         VideoComposer.merge_segment raises RuntimeError when FFmpeg exits non-zero.
         """
-        from composer.ffmpeg_merge import VideoComposer
-
+        # Inputs are never opened: _get_duration and subprocess.run are mocked
         video = tmp_path / "seg.mp4"
         audio = tmp_path / "seg.wav"
         out = tmp_path / "merged.mp4"
-        video.write_bytes(b"fake")
-        audio.write_bytes(b"fake")
 
-        with patch.object(VideoComposer, "_verify_ffmpeg", return_value=None):
-            vc = VideoComposer()
-            # Mock _get_duration to return non-zero values
-            with patch.object(vc, "_get_duration", return_value=5.0):
-                # Mock subprocess.run to simulate FFmpeg failure
-                with patch("subprocess.run") as mock_run:
-                    mock_run.return_value = MagicMock(returncode=1, stderr="FFmpeg error: codec not found")
-                    with pytest.raises(RuntimeError, match="FFmpeg merge failed"):
-                        vc.merge_segment(video, audio, out)
+        vc = VideoComposer()
+        # Mock _get_duration to return non-zero values
+        with patch.object(vc, "_get_duration", return_value=5.0):
+            # Mock subprocess.run to simulate FFmpeg failure
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = CompletedProcess(args=[], returncode=1, stderr="FFmpeg error: codec not found")
+                with pytest.raises(RuntimeError, match="FFmpeg merge failed"):
+                    vc.merge_segment(video, audio, out)
 
     def test_7_7_concatenate_ffmpeg_failure_raises_runtime_error(self, tmp_path):
         """
         VideoComposer._concat_demuxer raises RuntimeError when FFmpeg concat fails.
         """
-        from composer.ffmpeg_merge import VideoComposer
-
+        # Segments are only listed in the concat file; subprocess.run is mocked
         seg1 = tmp_path / "seg1.mp4"
         seg2 = tmp_path / "seg2.mp4"
         out = tmp_path / "out.mp4"
-        seg1.write_bytes(b"fake")
-        seg2.write_bytes(b"fake")
 
-        with patch.object(VideoComposer, "_verify_ffmpeg", return_value=None):
-            vc = VideoComposer()
+        vc = VideoComposer()
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = CompletedProcess(args=[], returncode=1, stderr="concat error")
+            with pytest.raises(RuntimeError, match="FFmpeg concat failed"):
+                vc.concatenate([str(seg1), str(seg2)], str(out), crossfade=0)
+
+
+# ── Raw frames piped on stdin ─────────────────────────────────────────────────
+
+class _FakeStdin:
+    def __init__(self):
+        self.written = bytearray()
+        self.closed = False
+
+    def write(self, data):
+        self.written += data
+
+    def close(self):
+        self.closed = True
+
+
+def _fake_popen(returncode: int = 0, stderr: bytes = b"", partial: Path | None = None):
+    """Popen stand-in; `partial` is written as if FFmpeg had started the output."""
+    if partial is not None:
+        partial.write_bytes(b"truncated mp4")
+    return SimpleNamespace(
+        stdin=_FakeStdin(),
+        stderr=io.BytesIO(stderr),
+        wait=lambda: returncode,
+    )
+
+
+@pytest.mark.usefixtures("_no_ffmpeg_check")
+class TestVideoComposerMergeSegmentStream:
+
+    def test_frames_written_to_stdin_and_closed(self, tmp_path):
+        frames = [b"\x01" * 6, b"\x02" * 6, b"\x03" * 6]
+        proc = _fake_popen()
+        with patch("subprocess.Popen", return_value=proc) as mock_popen:
+            result = VideoComposer().merge_segment_stream(
+                iter(frames), tmp_path / "a.wav", tmp_path / "out.mp4", size="2x2",
+            )
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("-i") + 1] == "pipe:0"
+        assert cmd[cmd.index("-s") + 1] == "2x2"
+        assert bytes(proc.stdin.written) == b"".join(frames)
+        assert proc.stdin.closed
+        assert result == tmp_path / "out.mp4"
+
+    def test_ffmpeg_failure_raises_runtime_error(self, tmp_path):
+        proc = _fake_popen(returncode=1, stderr=b"bad frame size")
+        with patch("subprocess.Popen", return_value=proc):
+            with pytest.raises(RuntimeError, match="FFmpeg stream merge failed: bad frame size"):
+                VideoComposer().merge_segment_stream(
+                    [b"\x00"], tmp_path / "a.wav", tmp_path / "out.mp4",
+                )
+
+    def test_frame_source_error_raised_after_stdin_closed(self, tmp_path):
+        def frames():
+            yield b"\x00"
+            raise ValueError("renderer died")
+
+        proc = _fake_popen()
+        with patch("subprocess.Popen", return_value=proc):
+            with pytest.raises(RuntimeError, match="renderer died"):
+                VideoComposer().merge_segment_stream(
+                    frames(), tmp_path / "a.wav", tmp_path / "out.mp4",
+                )
+        assert proc.stdin.closed
+
+    @pytest.mark.parametrize("returncode,frames", [
+        pytest.param(1, [b"\x00"], id="ffmpeg_exits_nonzero"),
+        pytest.param(0, None, id="frame_source_raises"),
+    ])
+    def test_partial_output_removed_on_failure(self, tmp_path, returncode, frames):
+        def failing_frames():
+            yield b"\x00"
+            raise ValueError("renderer died")
+
+        out = tmp_path / "out.mp4"
+        proc = _fake_popen(returncode=returncode, partial=out)
+        with patch("subprocess.Popen", return_value=proc):
+            with pytest.raises(RuntimeError):
+                VideoComposer().merge_segment_stream(
+                    frames if frames is not None else failing_frames(), tmp_path / "a.wav", out,
+                )
+        assert not out.exists()
+
+
+# ── Single-pass merge + concat ────────────────────────────────────────────────
+
+@pytest.mark.usefixtures("_no_ffmpeg_check")
+class TestVideoComposerRenderFull:
+
+    def test_empty_segment_list_raises_value_error(self, tmp_path):
+        with pytest.raises(ValueError, match="No segments"):
+            VideoComposer().render_full([], tmp_path / "out.mp4")
+
+    def test_one_ffmpeg_run_concats_all_pairs(self, tmp_path):
+        """Every pair becomes two inputs of a single FFmpeg concat filter graph."""
+        vc = VideoComposer()
+        segments = [
+            (tmp_path / "b1.mp4", tmp_path / "b1.wav"),
+            (tmp_path / "b2.mp4", None),   # silent beat → generated silence input
+        ]
+        with patch.object(vc, "_get_duration", return_value=5.0):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = CompletedProcess(args=[], returncode=0, stderr="")
+                result = vc.render_full(segments, tmp_path / "final.mp4")
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "concat=n=2:v=1:a=1[v][a]" in graph
+        assert str(tmp_path / "b1.wav") in cmd
+        assert "anullsrc=r=44100:cl=stereo" in cmd
+        assert result == tmp_path / "final.mp4"
+
+    def test_ffmpeg_failure_raises_runtime_error(self, tmp_path):
+        vc = VideoComposer()
+        with patch.object(vc, "_get_duration", return_value=5.0):
             with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(returncode=1, stderr="concat error")
-                with pytest.raises(RuntimeError, match="FFmpeg concat failed"):
-                    vc.concatenate([str(seg1), str(seg2)], str(out), crossfade=0)
+                mock_run.return_value = CompletedProcess(args=[], returncode=1, stderr="filter error")
+                with pytest.raises(RuntimeError, match="FFmpeg render_full failed"):
+                    vc.render_full([(tmp_path / "b1.mp4", tmp_path / "b1.wav")], tmp_path / "out.mp4")
 
 
 # ── render_errors in job status ───────────────────────────────────────────────
@@ -237,29 +308,23 @@ class TestRenderErrorsInJobStatus:
         assert "render_errors" in job_status
         assert job_status["render_errors"] == render_errors
 
-    async def test_render_errors_contains_error_message(self, tmp_path):
+    async def test_render_errors_contains_error_message(self, tmp_path, patch_to_thread):
         """Error strings in render_errors dict are non-empty."""
-        from renderer.render_engine import render_all_parallel
-
         tasks = [("b1", tmp_path / "s.py", "MyScene_b1", tmp_path / "m")]
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = RuntimeError("Manim render failed for 'MyScene_b1': out of memory")
-            rendered_map, errors = await render_all_parallel(tasks)
+        patch_to_thread.side_effect = RuntimeError("Manim render failed for 'MyScene_b1': out of memory")
+        rendered_map, errors = await render_all_parallel(tasks)
 
         for key, msg in errors.items():
             assert len(msg) > 0
 
-    async def test_errors_dict_is_empty_when_all_succeed(self, tmp_path):
+    async def test_errors_dict_is_empty_when_all_succeed(self, tmp_path, patch_to_thread):
         """When all renders succeed, errors dict is empty."""
-        from renderer.render_engine import render_all_parallel
-
         fake_mp4 = tmp_path / "b1.mp4"
         fake_mp4.write_bytes(b"fake")
 
         tasks = [("b1", tmp_path / "s.py", "MyScene_b1", tmp_path / "m")]
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = fake_mp4
-            rendered_map, errors = await render_all_parallel(tasks)
+        patch_to_thread.return_value = fake_mp4
+        rendered_map, errors = await render_all_parallel(tasks)
 
         assert errors == {}
 
@@ -270,17 +335,13 @@ class TestVideoComposerInstantiation:
 
     def test_video_composer_raises_runtime_error_when_ffmpeg_missing(self):
         """VideoComposer raises RuntimeError if FFmpeg binary is not found."""
-        from composer.ffmpeg_merge import VideoComposer
-        import subprocess
-
         with patch("subprocess.run", side_effect=FileNotFoundError("ffmpeg not found")):
             with pytest.raises(RuntimeError, match="FFmpeg not found"):
                 VideoComposer(ffmpeg_path="nonexistent_ffmpeg")
 
     def test_video_composer_initialised_with_mock(self):
         """VideoComposer can be instantiated when _verify_ffmpeg is mocked."""
-        from composer.ffmpeg_merge import VideoComposer
-
+        # Function-scoped: the real check must stay live for the sibling test.
         with patch.object(VideoComposer, "_verify_ffmpeg", return_value=None):
             vc = VideoComposer()
-            assert vc.ffmpeg_path == "ffmpeg"
+        assert vc.ffmpeg_path == "ffmpeg"
@@ -15,7 +15,8 @@ from __future__ import annotations
 import asyncio
 import shutil
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -71,8 +72,8 @@ class TestMinBeatDuration:
         ]
         # Simulate the duration computation loop from main.py
         audio_clips = {
-            "b1": MagicMock(duration=5.0),
-            "b2": MagicMock(duration=12.0),
+            "b1": SimpleNamespace(duration=5.0),
+            "b2": SimpleNamespace(duration=12.0),
             # b3 has no audio clip (TTS failed)
         }
         min_beat_duration = 10.0
@@ -131,12 +132,9 @@ class TestBeatOrdering:
         # Alphabetical order would be: def_1, hook_1, hook_2, sum_1 — different
         assert beat_order != sorted(beat_order)
 
-    def test_beat_order_preserved_for_22_beats(self):
+    def test_beat_order_preserved_for_22_beats(self, beats_fixture):
         """22-beat list preserves order exactly."""
-        import json
-        from pathlib import Path
-        FIXTURES = Path(__file__).parent.parent / "fixtures" / "beats"
-        beats = json.loads((FIXTURES / "many_beats.json").read_text())
+        beats = beats_fixture("many_beats.json")
         beat_order = [b["beat_id"] for b in beats]
         expected = [f"beat_{i}" for i in range(1, 23)]
         assert beat_order == expected
@@ -184,28 +182,25 @@ class TestComposerMergeNoAudio:
         mock_get_vc.assert_not_called()
         assert out.exists()
 
-    async def test_audio_path_exists_calls_video_composer(self, tmp_path):
+    async def test_audio_path_exists_calls_video_composer(self, tmp_path, patch_to_thread):
         """
         When audio_path exists, merge_segment delegates to VideoComposer.merge_segment
         via asyncio.to_thread.
         """
         from renderer.composer import merge_segment
 
-        video = tmp_path / "segment.mp4"
+        video = tmp_path / "segment.mp4"   # never opened: to_thread is mocked
         audio = tmp_path / "segment.wav"
         out = tmp_path / "out.mp4"
-        video.write_bytes(b"fake mp4")
-        audio.write_bytes(b"fake wav")
+        audio.write_bytes(b"fake wav")     # merge_segment checks audio_path.exists()
 
-        mock_vc = MagicMock()
-        mock_vc.merge_segment = MagicMock(return_value=out)
+        mock_vc = SimpleNamespace(merge_segment=lambda *a, **kw: out)
 
         with patch("renderer.composer._get_vc", return_value=mock_vc):
-            with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-                mock_thread.return_value = out
-                result = await merge_segment(video, audio, out)
+            patch_to_thread.return_value = out
+            result = await merge_segment(video, audio, out)
 
-        mock_thread.assert_called_once()
+        patch_to_thread.assert_called_once()
 
 
 # ── Composer: concat_segments ─────────────────────────────────────────────────
@@ -219,39 +214,32 @@ class TestComposerConcatSegments:
         with pytest.raises(ValueError, match="No segments"):
             await concat_segments([], Path("/tmp/out.mp4"))
 
-    async def test_one_segment_calls_video_composer_concatenate(self, tmp_path):
+    async def test_one_segment_calls_video_composer_concatenate(self, tmp_path, patch_to_thread):
         """Single segment → VideoComposer.concatenate is called (handles 1 segment by copy)."""
         from renderer.composer import concat_segments
 
-        seg = tmp_path / "seg1.mp4"
-        seg.write_bytes(b"fake")
+        seg = tmp_path / "seg1.mp4"   # never opened: to_thread is mocked
         out = tmp_path / "out.mp4"
 
-        mock_vc = MagicMock()
-        mock_vc.concatenate = MagicMock(return_value=out)
+        mock_vc = SimpleNamespace(concatenate=lambda *a, **kw: out)
 
         with patch("renderer.composer._get_vc", return_value=mock_vc):
-            with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-                mock_thread.return_value = out
-                result = await concat_segments([seg], out)
+            patch_to_thread.return_value = out
+            result = await concat_segments([seg], out)
 
-        mock_thread.assert_called_once()
+        patch_to_thread.assert_called_once()
 
-    async def test_multiple_segments_calls_video_composer_concatenate(self, tmp_path):
+    async def test_multiple_segments_calls_video_composer_concatenate(self, tmp_path, patch_to_thread):
         """Multiple segments → VideoComposer.concatenate is called."""
         from renderer.composer import concat_segments
 
-        segs = [tmp_path / f"seg{i}.mp4" for i in range(3)]
-        for s in segs:
-            s.write_bytes(b"fake")
+        segs = [tmp_path / f"seg{i}.mp4" for i in range(3)]   # never opened
         out = tmp_path / "out.mp4"
 
-        mock_vc = MagicMock()
-        mock_vc.concatenate = MagicMock(return_value=out)
+        mock_vc = SimpleNamespace(concatenate=lambda *a, **kw: out)
 
         with patch("renderer.composer._get_vc", return_value=mock_vc):
-            with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-                mock_thread.return_value = out
-                result = await concat_segments(segs, out)
+            patch_to_thread.return_value = out
+            result = await concat_segments(segs, out)
 
-        mock_thread.assert_called_once()
+        patch_to_thread.assert_called_once()
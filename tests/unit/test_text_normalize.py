@@ -10,8 +10,9 @@ No Manim rendering occurs — pure Python logic tests.
 from __future__ import annotations
 
 import pytest
+from manim import BLUE, GREEN, WHITE, YELLOW
 
-from scenes.base import normalize_text, resolve_color
+from scenes.base import _compile_replacements, normalize_text, resolve_color
 
 
 # ── normalize_text ────────────────────────────────────────────────────────────
@@ -86,30 +87,52 @@ class TestNormalizeText:
         """<- → ←"""
         assert normalize_text("a <- b") == "a ← b"
 
-    def test_double_arrow_bidirectional_partial_replacement(self):
-        """
-        <=> is NOT handled atomically. The replacement list processes <= before <=>,
-        so '<=' in '<=> ' is replaced first, producing '≤>' rather than '⟺'.
-        This documents actual behavior: <=> → ≤>
-        """
-        result = normalize_text("<=>")
-        # <= is applied before <=> in the list, so we get ≤> not ⟺
-        assert result == "≤>"
-
-    def test_replacement_order_less_equal_before_bidir(self):
-        """
-        Because the replacement list applies '<=' before '<=>', the string '<='
-        inside '<=>' is replaced first. Document the actual processing order.
-        """
-        result = normalize_text("<=>")
-        # <= replaces to ≤, leaving ≤>
-        assert "≤" in result
+    def test_double_arrow_bidirectional_replaced(self):
+        """<=> → ⟺ (the longer pattern wins over its '<=' prefix)"""
+        assert normalize_text("<=>") == "⟺"
+
+    def test_bidirectional_inside_sentence(self):
+        """<=> is replaced atomically, leaving no stray '≤' or '>'."""
+        result = normalize_text("p <=> q")
+        assert result == "p ⟺ q"
+        assert "≤" not in result
 
     def test_repeated_pattern_all_replaced(self):
         """All instances of the pattern in the string are replaced."""
         result = normalize_text("a != b and c != d")
         assert result == "a ≠ b and c ≠ d"
 
+    def test_text_without_trigger_chars_returned_as_is(self):
+        """No pattern can match, so the input object itself comes back."""
+        text = "Eigenvalues of a 2x2 matrix"
+        assert normalize_text(text) is text
+
+    def test_repeated_input_served_from_cache(self):
+        normalize_text.cache_clear()
+        normalize_text("x >= 0")
+        normalize_text("x >= 0")
+        assert normalize_text.cache_info().hits == 1
+
+    @pytest.mark.parametrize("text,expected", [
+        ("a <-> b", "a ↔ b"),   # own entry, not "←>" / "<→"
+        ("a <=> b", "a ⟺ b"),
+        # Leftmost-longest match wins where patterns overlap; the old
+        # sequential str.replace chain gave "!≠" and "<≠" here.
+        ("a !=/ b", "a ≠/ b"),
+        ("a <=/ b", "a ≤/ b"),
+        ("a =/= b", "a ≠= b"),
+        ("a --> b", "a -→ b"),
+    ])
+    def test_overlapping_patterns(self, text, expected):
+        assert normalize_text(text) == expected
+
+    def test_single_char_pattern_does_not_preempt_longer_ones(self):
+        """A one-character key shares the longest-first alternation with "->"/"<-"/"<=" ."""
+        mapping = {"-": "−", "->": "→", "<-": "←", "<=": "≤", "<": "‹"}
+        pattern = _compile_replacements(mapping)
+        result = pattern.sub(lambda m: mapping[m.group(0)], "a -> b <- c <= d - e < f")
+        assert result == "a → b ← c ≤ d − e ‹ f"
+
 
 # ── resolve_color ─────────────────────────────────────────────────────────────
 
@@ -117,18 +140,15 @@ class TestResolveColor:
 
     def test_known_color_name_resolved(self):
         """Uppercase 'BLUE' resolves to the Manim BLUE color object."""
-        from manim import BLUE
         result = resolve_color("BLUE")
         assert result is BLUE
 
     def test_lowercase_color_name_resolved(self):
         """Case-insensitive: 'blue' also resolves."""
-        from manim import BLUE
         result = resolve_color("blue")
         assert result is BLUE
 
     def test_yellow_resolved(self):
-        from manim import YELLOW
         assert resolve_color("YELLOW") is YELLOW
 
     def test_hex_string_passed_through(self):
@@ -143,44 +163,41 @@ class TestResolveColor:
 
     def test_unknown_name_returns_fallback(self):
         """Unknown color name returns the fallback (default YELLOW)."""
-        from manim import YELLOW
         result = resolve_color("NOTACOLOR")
         assert result is YELLOW
 
     def test_unknown_name_with_custom_fallback(self):
         """Unknown color name with custom fallback returns that fallback."""
-        from manim import BLUE
         result = resolve_color("NOTACOLOR", fallback=BLUE)
         assert result is BLUE
 
     def test_non_string_passed_through(self):
         """Non-string value (already a Manim color object) is passed through."""
-        from manim import GREEN
         assert resolve_color(GREEN) is GREEN
 
     def test_alias_cyan_resolves(self):
         """'CYAN' is an alias → should not return the fallback."""
-        from manim import YELLOW
         result = resolve_color("CYAN")
         assert result is not YELLOW  # should resolve to something valid
 
     def test_alias_magenta_resolves(self):
-        from manim import YELLOW
         result = resolve_color("MAGENTA")
         assert result is not YELLOW
 
     def test_white_resolved(self):
-        from manim import WHITE
         assert resolve_color("WHITE") is WHITE
 
     def test_empty_string_falls_back(self):
         """Empty string → not in map, not a valid hex → returns fallback."""
-        from manim import YELLOW
         result = resolve_color("")
         assert result is YELLOW
 
     def test_short_hex_falls_back(self):
         """Short hex '#FFF' is not exactly 7 or 9 chars → falls back."""
-        from manim import YELLOW
         result = resolve_color("#FFF")
         assert result is YELLOW
+
+    def test_surrounding_whitespace_ignored(self):
+        """Names are stripped before lookup, cached or not."""
+        assert resolve_color("  blue ") is BLUE
+        assert resolve_color("  blue ") is BLUE
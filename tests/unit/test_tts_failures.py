@@ -11,11 +11,12 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from narration.sarvam_client import AudioClip
+from narration.audio_cache import AudioCache
+from narration.sarvam_client import AudioClip, SarvamTTS
 from tts.sarvam import generate_all_audio, generate_audio_async
 
 
@@ -23,7 +24,7 @@ from tts.sarvam import generate_all_audio, generate_audio_async
 
 def _make_clip(duration: float = 3.0, audio_bytes: bytes = b"RIFF\x00\x00\x00\x00WAVE") -> AudioClip:
     """Return a minimal AudioClip (WAV header prefix is enough for the code path)."""
-    # Build a proper RIFF header to satisfy the RIFF check in _clip_to_wav
+    # Build a proper RIFF header to satisfy the RIFF check in _write_wav
     import io, wave
     buf = io.BytesIO()
     with wave.open(buf, "wb") as wf:
@@ -41,21 +42,21 @@ def _make_clip(duration: float = 3.0, audio_bytes: bytes = b"RIFF\x00\x00\x00\x0
     )
 
 
-def _make_tts(clip: AudioClip | None = None, side_effect=None) -> MagicMock:
+def _make_tts(clip: AudioClip | None = None, side_effect=None) -> Mock:
     """Return a mock SarvamTTS whose generate() returns clip (or raises side_effect)."""
-    tts = MagicMock()
+    tts = Mock(spec=SarvamTTS)
     if side_effect is not None:
-        tts.generate = MagicMock(side_effect=side_effect)
+        tts.generate = Mock(side_effect=side_effect)
     else:
-        tts.generate = MagicMock(return_value=clip or _make_clip())
+        tts.generate = Mock(return_value=clip or _make_clip())
     return tts
 
 
-def _make_cache(cached_clip: AudioClip | None = None) -> MagicMock:
+def _make_cache(cached_clip: AudioClip | None = None) -> Mock:
     """Return a mock AudioCache that always misses (or returns cached_clip)."""
-    cache = MagicMock()
-    cache.get = MagicMock(return_value=cached_clip)
-    cache.put = MagicMock()
+    cache = Mock(spec=AudioCache)
+    cache.get = Mock(return_value=cached_clip)
+    cache.put = Mock()
     return cache
 
 
@@ -80,6 +81,15 @@ class TestGenerateAudioAsync:
         tts.generate.assert_not_called()
         assert clip.audio_bytes == b""
 
+    async def test_4_1_blank_narrations_share_one_placeholder(self):
+        """Every blank narration returns the same silent clip — no per-beat allocation."""
+        tts = _make_tts()
+        cache = _make_cache()
+        first = await generate_audio_async("", "shubh", "en", tts, cache)
+        second = await generate_audio_async("  \n", "shubh", "en", tts, cache)
+        assert first is second
+        assert first.duration == 5.0
+
     async def test_4_2_none_narration_handled(self):
         """
         generate_audio_async expects a str. If None is passed it would fail on
@@ -10,66 +10,108 @@ Functions:
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import io
 import logging
+import os
+import struct
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+from config.settings import settings
 from narration.audio_cache import AudioCache
 from narration.sarvam_client import AudioClip, SarvamTTS
 
 log = logging.getLogger(__name__)
 
+# pydub is only needed for the non-16-bit fallback; probe once without importing
+# it (pydub warns at import time when ffmpeg is missing).
+_PYDUB_AVAILABLE = importlib.util.find_spec("pydub") is not None
+
+# One bounded pool for every job in the process: concurrent jobs queue here
+# instead of each bursting a thread per beat at the Sarvam API.
+_DEFAULT_TTS_CONCURRENCY = 4
+_tts_executor: ThreadPoolExecutor | None = None  # lazy singleton — created on first use
+
+
+def _tts_workers() -> int:
+    """settings.tts_concurrency if set, else min(CPUs this process may use, 4)."""
+    if settings.tts_concurrency:
+        return max(1, settings.tts_concurrency)
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    return min(cpus, _DEFAULT_TTS_CONCURRENCY)
+
+
+def _get_tts_executor() -> ThreadPoolExecutor:
+    global _tts_executor
+    if _tts_executor is None:
+        workers = _tts_workers()
+        log.info("Sarvam TTS concurrency: %d", workers)
+        _tts_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sarvam-tts")
+    return _tts_executor
+
+
+# Separate small pool for .wav writes, so disk I/O never queues behind (or
+# occupies) TTS slots and stays capped when many beats finish together.
+_IO_WORKERS = 4
+_io_executor: ThreadPoolExecutor | None = None  # lazy singleton — created on first use
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="tts-io")
+    return _io_executor
+
 
 # ── Silence trimming ──────────────────────────────────────────────────────────
 
+_SILENCE_THRESH = 32768 * 10 ** (-40 / 20)  # -40 dBFS on 16-bit PCM
+_WINDOW_MS = 10   # RMS window
+_PAD_MS = 50      # silence kept either side of the speech
+
+
 def _trim_silence(clip: AudioClip) -> AudioClip:
     """
-    Trim leading and trailing silence from an AudioClip using pydub.
-
-    Falls back gracefully if pydub is not installed or clip is empty.
-    Returns the original clip unchanged if no non-silent sections are found.
+    Trim leading and trailing silence from an AudioClip.
+
+    16-bit PCM (Sarvam's format, WAV or raw) is scanned with a vectorised
+    NumPy RMS and sliced directly; other sample widths go through pydub.
+    Returns the original clip unchanged if it is empty, shorter than
+    settings.tts_trim_min_duration (every beat is padded to
+    min_beat_duration anyway), has nothing to trim, or has no non-silent
+    sections.
     """
-    if not clip.audio_bytes:
-        return clip
-
-    try:
-        import io as _io
-
-        from pydub import AudioSegment
-        from pydub.silence import detect_nonsilent
-    except ImportError:
+    if not clip.audio_bytes or clip.duration <= settings.tts_trim_min_duration:
         return clip
 
     try:
-        # audio_bytes may be a complete WAV file (with RIFF header) or raw PCM.
-        # Always try WAV first; fall back to raw PCM interpretation.
-        raw = clip.audio_bytes
-        if raw[:4] == b"RIFF":
-            seg = AudioSegment.from_file(_io.BytesIO(raw), format="wav")
-        else:
-            seg = AudioSegment(
-                data=raw,
-                sample_width=2,
-                frame_rate=clip.sample_rate or 22050,
-                channels=1,
-            )
+        pcm16 = _read_pcm16(clip)
+        if pcm16 is None:
+            return _trim_silence_pydub(clip)
+        pcm, rate, channels = pcm16
 
-        ranges = detect_nonsilent(seg, min_silence_len=100, silence_thresh=-40)
-        if not ranges:
+        bounds = _nonsilent_bounds(pcm, rate, channels)
+        if bounds is None:
             return clip
 
-        start_ms = max(0, ranges[0][0] - 50)
-        end_ms = min(len(seg), ranges[-1][1] + 50)
-        trimmed = seg[start_ms:end_ms]
+        n_frames = len(pcm) // (2 * channels)
+        pad = rate * _PAD_MS // 1000
+        start = max(0, bounds[0] - pad)
+        end = min(n_frames, bounds[1] + pad)
+        if start == 0 and end == n_frames:
+            return clip  # nothing to trim — skip the WAV re-encode
 
-        # Export trimmed segment back to WAV bytes
-        buf = _io.BytesIO()
-        trimmed.export(buf, format="wav")
-        new_bytes = buf.getvalue()
+        # Header + zero-copy view of the kept frames, joined in a single copy.
+        frame_bytes = 2 * channels
+        body = memoryview(pcm)[start * frame_bytes:end * frame_bytes]
 
-        new_dur = len(trimmed) / 1000.0
         return AudioClip(
-            audio_bytes=new_bytes,
-            duration=new_dur,
+            audio_bytes=b"".join((_wav_header(body.nbytes, rate, channels), body)),
+            duration=(end - start) / rate,
             sample_rate=clip.sample_rate,
             text=clip.text,
         )
@@ -78,8 +120,90 @@ def _trim_silence(clip: AudioClip) -> AudioClip:
         return clip
 
 
+def _wav_header(data_bytes: int, rate: int, channels: int) -> bytes:
+    """Canonical 44-byte RIFF header for 16-bit PCM."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_bytes, b"WAVE",
+        b"fmt ", 16, 1, channels, rate, rate * channels * 2, channels * 2, 16,
+        b"data", data_bytes,
+    )
+
+
+def _read_pcm16(clip: AudioClip) -> tuple[bytes, int, int] | None:
+    """
+    Return (pcm, frame_rate, channels) for 16-bit PCM audio, or None otherwise.
+
+    audio_bytes may be a complete WAV file (with RIFF header) or raw PCM,
+    which is assumed to be 16-bit mono at clip.sample_rate.
+    """
+    raw = clip.audio_bytes
+    if raw[:4] != b"RIFF":
+        return raw, clip.sample_rate or 22050, 1
+
+    try:
+        with wave.open(io.BytesIO(raw), "rb") as wf:
+            if wf.getsampwidth() != 2:
+                return None
+            return wf.readframes(wf.getnframes()), wf.getframerate(), wf.getnchannels()
+    except wave.Error:
+        return None  # not plain PCM (float, extensible, …) — leave it to pydub
+
+
+def _nonsilent_bounds(pcm: bytes, rate: int, channels: int) -> tuple[int, int] | None:
+    """First and last+1 frame of the windows louder than the silence threshold."""
+    samples = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2)
+    if not samples.size:
+        return None
+
+    step = max(1, rate * _WINDOW_MS // 1000) * channels
+    starts = np.arange(0, samples.size, step)
+    squared = samples.astype(np.float32) ** 2
+    counts = np.diff(starts, append=samples.size)
+    rms = np.sqrt(np.add.reduceat(squared, starts) / counts)
+
+    loud = np.flatnonzero(rms > _SILENCE_THRESH)
+    if not loud.size:
+        return None
+    frames = samples.size // channels
+    return int(starts[loud[0]]) // channels, min(frames, int(starts[loud[-1]] + step) // channels)
+
+
+def _trim_silence_pydub(clip: AudioClip) -> AudioClip:
+    """pydub fallback for WAVs that are not 16-bit PCM (other widths, float, extensible)."""
+    if not _PYDUB_AVAILABLE:
+        return clip
+
+    from pydub import AudioSegment
+    from pydub.silence import detect_nonsilent
+
+    seg = AudioSegment.from_file(io.BytesIO(clip.audio_bytes), format="wav")
+    ranges = detect_nonsilent(seg, min_silence_len=100, silence_thresh=-40)
+    if not ranges:
+        return clip
+
+    start_ms = max(0, ranges[0][0] - _PAD_MS)
+    end_ms = min(len(seg), ranges[-1][1] + _PAD_MS)
+    if start_ms == 0 and end_ms == len(seg):
+        return clip
+    trimmed = seg[start_ms:end_ms]
+
+    buf = io.BytesIO()
+    trimmed.export(buf, format="wav")
+    return AudioClip(
+        audio_bytes=buf.getvalue(),
+        duration=len(trimmed) / 1000.0,
+        sample_rate=clip.sample_rate,
+        text=clip.text,
+    )
+
+
 # ── Single beat audio ─────────────────────────────────────────────────────────
 
+# Silent placeholder returned for every blank narration — shared, treat as read-only.
+_EMPTY_CLIP = AudioClip(audio_bytes=b"", duration=5.0, text="")
+
+
 async def generate_audio_async(
     narration: str,
     voice: str,
@@ -93,16 +217,50 @@ async def generate_audio_async(
     Returns an empty AudioClip (audio_bytes=b"", duration=5.0) for blank narration.
     """
     text = narration.strip()
+    clip = _lookup(text, voice, language, cache)
+    if clip is not None:
+        return clip
+    return await _synthesize(text, voice, language, tts, cache)
+
+
+def _lookup(text: str, voice: str, language: str, cache: AudioCache) -> AudioClip | None:
+    """
+    Resolve a stripped narration without calling Sarvam.
+
+    Returns the silent placeholder for blank text, the cached clip on a hit,
+    or None on a cache miss.
+    """
     if not text:
-        return AudioClip(audio_bytes=b"", duration=5.0, text="")
+        return _EMPTY_CLIP
 
     cached = cache.get(text=text, voice=voice, language=language)
-    if cached is not None:
+    if cached is not None and log.isEnabledFor(logging.DEBUG):
         log.debug("Cache hit for: %.40s", text)
-        return cached
+    return cached
+
+
+async def _synthesize(
+    text: str,
+    voice: str,
+    language: str,
+    tts: SarvamTTS,
+    cache: AudioCache,
+) -> AudioClip:
+    """Call Sarvam for a cache miss, trim the result and store it in the cache."""
+    loop = asyncio.get_running_loop()
+    raw_clip = await loop.run_in_executor(_get_tts_executor(), tts.generate, text, language)
+    # Trim and cache write share one thread hop — neither runs on the event loop.
+    return await asyncio.to_thread(_trim_and_store, raw_clip, text, voice, language, cache)
 
-    loop = asyncio.get_event_loop()
-    raw_clip = await loop.run_in_executor(None, tts.generate, text, language)
+
+def _trim_and_store(
+    raw_clip: AudioClip,
+    text: str,
+    voice: str,
+    language: str,
+    cache: AudioCache,
+) -> AudioClip:
+    """Trim a fresh Sarvam clip and write it to the cache (blocking — run in a thread)."""
     trimmed = _trim_silence(raw_clip)
     cache.put(text=text, voice=voice, language=language, clip=trimmed)
     return trimmed
@@ -130,47 +288,96 @@ async def generate_all_audio(
         audio_dir: Directory where .wav files will be written.
 
     Returns:
-        Dict mapping beat_id → AudioClip (only for beats that succeeded).
+        Dict mapping beat_id → AudioClip in beat order (only for beats that
+        succeeded). A repeated beat_id keeps its last narration.
     """
     audio_dir = Path(audio_dir)
     audio_dir.mkdir(parents=True, exist_ok=True)
 
-    async def _generate_one(beat: dict) -> tuple[str, AudioClip | None]:
+    # One narration per beat_id (the last one wins), so each .wav is written once.
+    text_by_bid: dict[str, str] = {}
+    for beat in beats:
         bid = beat.get("beat_id", "")
-        narration = beat.get("narration", "")
         try:
-            clip = await generate_audio_async(narration, voice, language, tts, cache)
-            if clip.audio_bytes:
-                (audio_dir / f"{bid}.wav").write_bytes(_clip_to_wav(clip))
-            return bid, clip
+            text_by_bid[bid] = beat.get("narration", "").strip()
         except Exception as exc:  # noqa: BLE001
             log.error("TTS failed for beat '%s': %s", bid, exc)
-            return bid, None
 
-    results = await asyncio.gather(*[_generate_one(b) for b in beats])
-    return {bid: clip for bid, clip in results if clip is not None}
+    # Beats that share a narration share one lookup and one TTS call.
+    bids_by_text: dict[str, list[str]] = {}
+    for bid, text in text_by_bid.items():
+        bids_by_text.setdefault(text, []).append(bid)
+
+    clips: dict[str, AudioClip] = {}
+    writes: list[asyncio.Task] = []
+
+    async def _write_one(bid: str, clip: AudioClip) -> None:
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                _get_io_executor(), _write_wav, audio_dir / f"{bid}.wav", clip,
+            )
+        except Exception as exc:  # noqa: BLE001
+            log.error("TTS failed for beat '%s': %s", bid, exc)
+            clips.pop(bid, None)
+
+    def _resolved(bids: list[str], clip: AudioClip) -> None:
+        # Start the .wav writes (off the event loop) as soon as a clip is ready.
+        for bid in bids:
+            clips[bid] = clip
+            if clip.audio_bytes:
+                writes.append(asyncio.create_task(_write_one(bid, clip)))
+
+    # Phase 1: resolve blank narration and cache hits without touching the API.
+    misses: list[str] = []
+    for text, bids in bids_by_text.items():
+        try:
+            clip = _lookup(text, voice, language, cache)
+        except Exception as exc:  # noqa: BLE001
+            log.error("TTS failed for beats %s: %s", bids, exc)
+            continue
+        if clip is None:
+            misses.append(text)
+        else:
+            _resolved(bids, clip)
+
+    # Phase 2: only cache misses go to Sarvam, concurrently on the shared executor;
+    # each result is handed to the writers as it completes, not after the slowest.
+    async def _generate_one(text: str) -> tuple[str, AudioClip | None]:
+        try:
+            return text, await _synthesize(text, voice, language, tts, cache)
+        except Exception as exc:  # noqa: BLE001
+            log.error("TTS failed for beats %s: %s", bids_by_text[text], exc)
+            return text, None
+
+    # Tasks are created up front so requests are submitted in beat order.
+    for next_done in asyncio.as_completed([asyncio.create_task(_generate_one(t)) for t in misses]):
+        text, clip = await next_done
+        if clip is not None:
+            _resolved(bids_by_text[text], clip)
+
+    # Phase 3: wait for the outstanding .wav writes.
+    await asyncio.gather(*writes)
+
+    return {bid: clips[bid] for bid in text_by_bid if bid in clips}
 
 
 # ── WAV serialisation helper ──────────────────────────────────────────────────
 
-def _clip_to_wav(clip: AudioClip) -> bytes:
+def _write_wav(path: Path, clip: AudioClip) -> None:
     """
-    Return WAV bytes for the clip's audio.
+    Write the clip's audio to path as a WAV file (blocking — run in a thread).
 
-    If audio_bytes is already a WAV file (starts with RIFF), return it directly.
-    Otherwise wrap raw PCM in a WAV container.
+    If audio_bytes is already a WAV file (starts with RIFF), it is written as-is.
+    Otherwise raw PCM is wrapped in a WAV container streamed straight to disk,
+    with no intermediate in-memory copy.
     """
-    import io
-    import wave
-
     raw = clip.audio_bytes
     if raw[:4] == b"RIFF":
-        return raw  # already a complete WAV file
+        path.write_bytes(raw)  # already a complete WAV file (Sarvam output, trimmed or not)
+        return
 
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
+    with wave.open(str(path), "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(clip.sample_rate or 22050)
         wf.writeframes(raw)
-    return buf.getvalue()